@@ -1,10 +1,20 @@
 """FFmpeg-based audio extraction adapter."""
 
+import asyncio
+import os
 import subprocess
 import tempfile
 from pathlib import Path
 
-from video_transcriber.ports.audio_extractor import AudioExtractionError
+import numpy as np
+
+from video_transcriber.ports.audio_extractor import AudioExtractionError, AUDIO_ARRAY_SAMPLE_RATE
+
+
+FFMPEG_NOT_FOUND_MESSAGE = (
+    "ffmpeg not found. Please install ffmpeg: "
+    "apt install ffmpeg (Ubuntu/Debian) or brew install ffmpeg (macOS)"
+)
 
 
 class FFmpegAudioExtractor:
@@ -30,6 +40,37 @@ class FFmpegAudioExtractor:
         self.sample_rate = sample_rate
         self.channels = channels
 
+    def _build_command(self, video_path: str, output: str) -> list[str]:
+        """Build the ffmpeg command line.
+
+        Args:
+            video_path: Path to video file
+            output: Output WAV path, or "-" to stream raw PCM to stdout
+
+        Returns:
+            ffmpeg argument list
+        """
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output file
+            "-i", video_path,  # Input video
+            "-vn",  # No video output
+            "-acodec", "pcm_s16le",  # PCM 16-bit little-endian
+            "-ar", str(self.sample_rate),  # Sample rate
+            "-ac", str(self.channels),  # Audio channels
+        ]
+        if output == "-":
+            cmd += ["-f", "s16le"]  # Headerless PCM on stdout
+        cmd.append(output)
+        return cmd
+
+    def _create_temp_output(self) -> str:
+        """Create a temporary WAV path for ffmpeg to write to."""
+        fd, output_path = tempfile.mkstemp(suffix=".wav")
+        # Close the file descriptor, ffmpeg will create the file
+        os.close(fd)
+        return output_path
+
     def extract_audio(self, video_path: str, output_path: str | None = None) -> str:
         """Extract audio from video using ffmpeg subprocess.
 
@@ -46,22 +87,9 @@ class FFmpegAudioExtractor:
         """
         # Create temp file if no output path specified
         if output_path is None:
-            fd, output_path = tempfile.mkstemp(suffix=".wav")
-            # Close the file descriptor, ffmpeg will create the file
-            import os
-            os.close(fd)
+            output_path = self._create_temp_output()
 
-        # Build ffmpeg command
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output file
-            "-i", video_path,  # Input video
-            "-vn",  # No video output
-            "-acodec", "pcm_s16le",  # PCM 16-bit little-endian
-            "-ar", str(self.sample_rate),  # Sample rate
-            "-ac", str(self.channels),  # Audio channels
-            output_path
-        ]
+        cmd = self._build_command(video_path, output_path)
 
         try:
             # Run ffmpeg
@@ -87,11 +115,104 @@ class FFmpegAudioExtractor:
             return output_path
 
         except FileNotFoundError:
-            raise AudioExtractionError(
-                "ffmpeg not found. Please install ffmpeg: "
-                "apt install ffmpeg (Ubuntu/Debian) or brew install ffmpeg (macOS)"
-            )
+            raise AudioExtractionError(FFMPEG_NOT_FOUND_MESSAGE)
         except Exception as e:
             if isinstance(e, AudioExtractionError):
                 raise
             raise AudioExtractionError(f"Unexpected error during audio extraction: {e}")
+
+    async def extract_audio_async(self, video_path: str, output_path: str | None = None) -> str:
+        """Extract audio from video without blocking the event loop.
+
+        Behaves like extract_audio, but runs ffmpeg with
+        asyncio.create_subprocess_exec so other coroutines keep running
+        while a long video is transcoded.
+
+        Args:
+            video_path: Path to video file
+            output_path: Optional path for output audio file.
+                        If None, creates temporary WAV file.
+
+        Returns:
+            Path to extracted audio file (WAV format)
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails or video doesn't exist
+        """
+        if output_path is None:
+            output_path = self._create_temp_output()
+
+        cmd = self._build_command(video_path, output_path)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise AudioExtractionError(FFMPEG_NOT_FOUND_MESSAGE)
+
+        try:
+            _, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Don't leave ffmpeg running after the caller has given up
+            process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            error_msg = stderr.decode(errors="replace") or "Unknown error"
+            raise AudioExtractionError(
+                f"ffmpeg failed with code {process.returncode}: {error_msg}"
+            )
+
+        # Verify output file was created
+        if not Path(output_path).exists():
+            raise AudioExtractionError(
+                f"ffmpeg succeeded but output file not created: {output_path}"
+            )
+
+        return output_path
+
+    def extract_audio_array(self, video_path: str) -> np.ndarray:
+        """Extract audio from video straight into memory.
+
+        Streams raw PCM from ffmpeg's stdout instead of writing a temporary
+        WAV file, so the samples can be passed directly to
+        WhisperAudioTranscriber.transcribe_audio without touching the disk.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Mono float32 samples at 16kHz, scaled to [-1.0, 1.0)
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails or video doesn't exist, or if
+                                 the extractor is not configured for mono 16kHz
+                                 output, since raw samples carry no format
+                                 information and would be misread
+        """
+        if self.channels != 1 or self.sample_rate != AUDIO_ARRAY_SAMPLE_RATE:
+            raise AudioExtractionError(
+                f"In-memory audio must be mono at {AUDIO_ARRAY_SAMPLE_RATE}Hz, "
+                f"but extractor is configured for {self.channels} channel(s) "
+                f"at {self.sample_rate}Hz"
+            )
+
+        cmd = self._build_command(video_path, "-")
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=False)
+        except FileNotFoundError:
+            raise AudioExtractionError(FFMPEG_NOT_FOUND_MESSAGE)
+
+        if result.returncode != 0:
+            error_msg = result.stderr.decode(errors="replace") or "Unknown error"
+            raise AudioExtractionError(
+                f"ffmpeg failed with code {result.returncode}: {error_msg}"
+            )
+
+        samples = np.frombuffer(result.stdout, dtype=np.int16)
+        return samples.astype(np.float32) / 32768.0
@@ -1,8 +1,9 @@
 """OpenCV-based video reading adapter."""
 
+import os
 import sys
 import cv2
-from typing import Iterator
+from typing import Generator, Iterator
 
 from video_transcriber.ports.video_reader import VideoMetadata, Frame, VideoReadError
 
@@ -13,9 +14,43 @@ class OpenCVVideoAdapter:
     Reads video files and extracts frames using OpenCV.
     """
 
+    def __init__(self):
+        """Initialize the adapter with an empty metadata cache."""
+        # Keyed by (path, modification time) so edited files are re-read
+        self._metadata_cache: dict[tuple[str, int], VideoMetadata] = {}
+
     def get_metadata(self, video_path: str) -> VideoMetadata:
         """Get video file metadata using OpenCV.
 
+        Metadata for local files is cached until the file is modified, so
+        repeated calls do not reopen the container.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            VideoMetadata with video properties
+
+        Raises:
+            VideoReadError: If video cannot be opened
+        """
+        try:
+            cache_key = (video_path, os.stat(video_path).st_mtime_ns)
+        except OSError:
+            # Not a local file (or missing); let OpenCV report the error
+            cache_key = None
+
+        if cache_key in self._metadata_cache:
+            return self._metadata_cache[cache_key]
+
+        metadata = self._read_metadata(video_path)
+        if cache_key is not None:
+            self._metadata_cache[cache_key] = metadata
+        return metadata
+
+    def _read_metadata(self, video_path: str) -> VideoMetadata:
+        """Open the video with OpenCV and read its properties.
+
         Args:
             video_path: Path to video file
 
@@ -63,6 +98,54 @@ class OpenCVVideoAdapter:
         Yields:
             Frame objects with frame number, timestamp, and image
 
+        Raises:
+            VideoReadError: If video cannot be opened
+        """
+        cap = self._open(video_path)
+
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+            # Every seek restarts decoding at the previous keyframe, so it
+            # only pays off when samples are further apart than a typical
+            # keyframe interval. On tests/data/demo.mp4 (30 fps) seeking
+            # takes 0.5x the sequential time at 2 s intervals but 0.9x at
+            # 1 s, and files with longer keyframe intervals fare worse, so
+            # the default one-second sampling stays sequential.
+            timing = None
+            if fps > 0 and total_frames > 0 and sample_interval >= 2 * fps:
+                timing = self._probe_frame_timing(video_path, total_frames)
+
+            if timing is None:
+                yield from self._grab_frames(cap, fps, sample_interval, limit)
+                return
+
+            resume_from = yield from self._seek_frames(
+                cap, fps, total_frames, sample_interval, limit, *timing
+            )
+            if resume_from is not None:
+                # Seeking stopped landing on the requested frames, so read
+                # the rest of the video sequentially from a fresh capture
+                last_frame_number, yielded_count = resume_from
+                cap.release()
+                cap = self._open(video_path)
+                yield from self._grab_frames(
+                    cap, fps, sample_interval, limit - yielded_count,
+                    after_frame=last_frame_number
+                )
+        finally:
+            cap.release()
+
+    def _open(self, video_path: str) -> cv2.VideoCapture:
+        """Open a video capture.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Opened video capture
+
         Raises:
             VideoReadError: If video cannot be opened
         """
@@ -70,32 +153,182 @@ class OpenCVVideoAdapter:
 
         if not cap.isOpened():
             raise VideoReadError(f"Could not open video: {video_path}")
+        return cap
+
+    def _probe_frame_timing(
+        self,
+        video_path: str,
+        total_frames: int
+    ) -> tuple[float, float] | None:
+        """Measure frame timestamps to see whether seeking by time is reliable.
 
+        Uses a separate capture, so no frames are consumed from the one
+        being read.
+
+        Args:
+            video_path: Path to video file
+            total_frames: Number of frames reported by the container
+
+        Returns:
+            Timestamp of the first frame and spacing between frames in
+            milliseconds, or None if timestamps do not map to frame numbers
+        """
+        cap = cv2.VideoCapture(video_path)
         try:
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = 0
-            yielded_count = 0
+            if not cap.grab():
+                return None
+            first_msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+            if not cap.grab():
+                return None
+            frame_msec = cap.get(cv2.CAP_PROP_POS_MSEC) - first_msec
+            if frame_msec <= 0:
+                return None
+
+            # Frames are only evenly spaced if the last one is where the
+            # first two say it should be. Missing or extra frames (variable
+            # frame rate, as in screen recordings) move it, and then a
+            # timestamp no longer identifies a frame number.
+            last_msec = first_msec + (total_frames - 1) * frame_msec
+            landed_msec = self._seek_to(cap, last_msec, frame_msec)
+            if landed_msec is None or abs(landed_msec - last_msec) > frame_msec / 2:
+                return None
+            if cap.grab():
+                return None
+        finally:
+            cap.release()
+
+        return first_msec, frame_msec
+
+    def _grab_frames(
+        self,
+        cap: cv2.VideoCapture,
+        fps: float,
+        sample_interval: int,
+        limit: int,
+        after_frame: int = 0
+    ) -> Iterator[Frame]:
+        """Read frames sequentially, decoding only those at sample intervals.
+
+        Args:
+            cap: Opened video capture, positioned at the start of the video
+            fps: Frames per second of the video
+            sample_interval: Read every Nth frame
+            limit: Maximum number of frames to yield
+            after_frame: Only yield frames numbered above this (default: 0)
+
+        Yields:
+            Frame objects with frame number, timestamp, and image
+        """
+        frame_count = 0
+        yielded_count = 0
+
+        # grab() advances past a frame without converting it to a BGR
+        # image; only frames at sample intervals are retrieved
+        while cap.grab():
+            frame_count += 1
 
-            while True:
-                ret, image = cap.read()
+            # Only yield frames at sample intervals
+            if frame_count % sample_interval == 0 and frame_count > after_frame:
+                ret, image = cap.retrieve()
 
                 if not ret:
                     break
 
-                frame_count += 1
+                timestamp = frame_count / fps if fps > 0 else 0.0
 
-                # Only yield frames at sample intervals
-                if frame_count % sample_interval == 0:
-                    timestamp = frame_count / fps if fps > 0 else 0.0
+                # retrieve() allocates a new array per call, so the
+                # frame can own it without a defensive copy
+                yield Frame(
+                    frame_number=frame_count,
+                    timestamp_seconds=timestamp,
+                    image=image
+                )
 
-                    yield Frame(
-                        frame_number=frame_count,
-                        timestamp_seconds=timestamp,
-                        image=image.copy()
-                    )
+                yielded_count += 1
+                if yielded_count >= limit:
+                    break
 
-                    yielded_count += 1
-                    if yielded_count >= limit:
-                        break
-        finally:
-            cap.release()
+    def _seek_frames(
+        self,
+        cap: cv2.VideoCapture,
+        fps: float,
+        total_frames: int,
+        sample_interval: int,
+        limit: int,
+        first_msec: float,
+        frame_msec: float
+    ) -> Generator[Frame, None, tuple[int, int] | None]:
+        """Read frames at sample intervals by seeking directly to each one.
+
+        Seeks are made by timestamp, using the measured frame spacing,
+        because OpenCV converts a frame-number seek to a time with the
+        container's average frame rate, which can land a frame short. Each
+        seek is checked to have reached its target, so every yielded image
+        matches the one _grab_frames gives for that frame number.
+
+        Args:
+            cap: Opened video capture
+            fps: Frames per second of the video
+            total_frames: Number of frames reported by the container
+            sample_interval: Read every Nth frame
+            limit: Maximum number of frames to yield
+            first_msec: Timestamp of the first frame in milliseconds
+            frame_msec: Spacing between frames in milliseconds
+
+        Yields:
+            Frame objects with frame number, timestamp, and image
+
+        Returns:
+            None when done, or the last yielded frame number and the number
+            of frames yielded if a seek missed its target and the caller
+            must continue sequentially
+        """
+        yielded_count = 0
+        last_frame_number = 0
+
+        for frame_number in range(sample_interval, total_frames + 1, sample_interval):
+            target_msec = first_msec + (frame_number - 1) * frame_msec
+            landed_msec = self._seek_to(cap, target_msec, frame_msec)
+            if landed_msec is None:
+                return None
+            if abs(landed_msec - target_msec) > frame_msec / 2:
+                return last_frame_number, yielded_count
+
+            ret, image = cap.retrieve()
+            if not ret:
+                return None
+
+            yield Frame(
+                frame_number=frame_number,
+                timestamp_seconds=frame_number / fps,
+                image=image
+            )
+
+            last_frame_number = frame_number
+            yielded_count += 1
+            if yielded_count >= limit:
+                return None
+
+        return None
+
+    def _seek_to(self, cap: cv2.VideoCapture, target_msec: float, frame_msec: float) -> float | None:
+        """Grab the first frame at or after the one at target_msec, ready to retrieve.
+
+        Args:
+            cap: Opened video capture
+            target_msec: Timestamp of the wanted frame in milliseconds
+            frame_msec: Spacing between frames in milliseconds
+
+        Returns:
+            Timestamp of the grabbed frame, which is past the target if the
+            video has no frame there, or None if the video ended first
+        """
+        half_frame = frame_msec / 2
+
+        cap.set(cv2.CAP_PROP_POS_MSEC, max(target_msec - half_frame, 0.0))
+        if not cap.grab():
+            return None
+        while cap.get(cv2.CAP_PROP_POS_MSEC) < target_msec - half_frame:
+            if not cap.grab():
+                return None
+        return cap.get(cv2.CAP_PROP_POS_MSEC)
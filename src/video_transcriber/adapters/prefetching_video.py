@@ -0,0 +1,105 @@
+"""Video reader decorator that decodes frames ahead on a background thread."""
+
+import queue
+import sys
+import threading
+from typing import Iterator
+
+from video_transcriber.ports.video_reader import VideoMetadata, VideoReader, Frame
+
+
+_FINISHED = object()
+
+
+class PrefetchingVideoReader:
+    """Wraps a VideoReader so frames are decoded ahead of the consumer.
+
+    The wrapped reader runs on a background thread and fills a bounded queue,
+    so decoding the next frames overlaps with whatever the caller does with
+    the current one (hashing, comparison). OpenCV releases the GIL while
+    decoding, so the two genuinely run in parallel.
+    """
+
+    def __init__(self, video_reader: VideoReader, max_queued: int = 8):
+        """Initialize the prefetching reader.
+
+        Args:
+            video_reader: Reader to decode frames with
+            max_queued: Maximum number of decoded frames held ahead of the consumer
+        """
+        self.video_reader = video_reader
+        self.max_queued = max_queued
+
+    def get_metadata(self, video_path: str) -> VideoMetadata:
+        """Get video file metadata from the wrapped reader.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            VideoMetadata with video properties
+        """
+        return self.video_reader.get_metadata(video_path)
+
+    def read_frames(
+        self,
+        video_path: str,
+        sample_interval: int = 1,
+        limit: int = sys.maxsize
+    ) -> Iterator[Frame]:
+        """Read frames from the wrapped reader on a background thread.
+
+        Args:
+            video_path: Path to video file
+            sample_interval: Read every Nth frame (1 = every frame)
+            limit: Maximum number of frames to yield (default: unlimited)
+
+        Yields:
+            Frame objects in the order the wrapped reader produces them
+
+        Raises:
+            Any error raised by the wrapped reader, such as VideoReadError
+        """
+        frames: queue.Queue = queue.Queue(maxsize=self.max_queued)
+        stopped = threading.Event()
+
+        def put(item) -> bool:
+            # Wait for room in the queue, giving up once the consumer stops
+            while not stopped.is_set():
+                try:
+                    frames.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for frame in self.video_reader.read_frames(video_path, sample_interval, limit):
+                    if not put(frame):
+                        return
+                put(_FINISHED)
+            except Exception as e:
+                put(e)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = frames.get()
+                if item is _FINISHED:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # The producer gives up within one put timeout of the stop flag;
+            # drop any frames it already queued so they can be freed
+            stopped.set()
+            while True:
+                try:
+                    frames.get_nowait()
+                except queue.Empty:
+                    break
+            producer.join()
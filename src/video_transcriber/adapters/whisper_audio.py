@@ -2,10 +2,21 @@
 
 from pathlib import Path
 
+import numpy as np
+
 from video_transcriber.ports.audio_transcriber import AudioTranscriptionError
 from video_transcriber.domain.models import AudioSegment
 
 
+QUALITY_PRESETS = {
+    # Greedy decoding without cross-window conditioning: several times faster
+    # and avoids repetition loops, with little WER cost on clean speech
+    "fast": {"beam_size": 1, "condition_on_previous_text": False},
+    # Whisper's reference decoding settings
+    "accurate": {"beam_size": 5, "condition_on_previous_text": True},
+}
+
+
 class WhisperAudioTranscriber:
     """Transcribe audio using faster-whisper.
 
@@ -22,33 +33,83 @@ class WhisperAudioTranscriber:
         model_size: str = "base",
         device: str = "auto",
         compute_type: str = "auto",
-        beam_size: int = 5
+        beam_size: int | None = None,
+        batch_size: int = 0,
+        quality_preset: str = "fast"
     ):
         """Initialize Whisper transcriber.
 
         Args:
             model_size: Whisper model size (tiny/base/small/medium/large-v3)
             device: Device to use (auto/cpu/cuda)
-            compute_type: Compute type (auto/int8/float16/float32)
-            beam_size: Beam size for decoding (higher = more accurate but slower)
+            compute_type: Compute type (auto/int8/int8_float16/float16/float32).
+                         "auto" selects int8 quantization where the device
+                         supports it (int8_float16, else int8), roughly 2x
+                         faster than float weights for a small loss in
+                         accuracy, and otherwise lets CTranslate2 choose.
+            beam_size: Beam size for decoding (higher = more accurate but slower).
+                      If None, taken from quality_preset.
+            batch_size: Number of speech chunks to decode together using
+                       faster-whisper's BatchedInferencePipeline (0 = unbatched)
+            quality_preset: Decoding preset, "fast" (greedy, default) or
+                           "accurate" (beam search of 5, conditioned on
+                           previous text)
+
+        Raises:
+            ValueError: If quality_preset is not recognised
         """
+        if quality_preset not in QUALITY_PRESETS:
+            raise ValueError(
+                f"Unknown quality_preset '{quality_preset}', "
+                f"expected one of: {', '.join(QUALITY_PRESETS)}"
+            )
+        preset = QUALITY_PRESETS[quality_preset]
+
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
-        self.beam_size = beam_size
+        self.beam_size = beam_size if beam_size is not None else preset["beam_size"]
+        self.condition_on_previous_text = preset["condition_on_previous_text"]
+        self.batch_size = batch_size
         self._model = None
 
+    def _resolve_compute_type(self) -> str:
+        """Resolve "auto" compute type to an int8 variant the device supports.
+
+        Prefers int8_float16, then int8. If the device supports neither,
+        "auto" is passed through so CTranslate2 picks a type itself, since
+        naming an unsupported type makes model loading fail.
+        """
+        if self.compute_type != "auto":
+            return self.compute_type
+
+        import ctranslate2
+
+        use_cuda = self.device == "cuda" or (
+            self.device == "auto" and ctranslate2.get_cuda_device_count() > 0
+        )
+        supported = ctranslate2.get_supported_compute_types("cuda" if use_cuda else "cpu")
+        for compute_type in ("int8_float16", "int8"):
+            if compute_type in supported:
+                return compute_type
+        return "auto"
+
     def _load_model(self):
         """Lazy-load Whisper model (downloads on first use)."""
         if self._model is None:
             try:
                 from faster_whisper import WhisperModel
 
-                self._model = WhisperModel(
+                model = WhisperModel(
                     self.model_size,
                     device=self.device,
-                    compute_type=self.compute_type
+                    compute_type=self._resolve_compute_type()
                 )
+                if self.batch_size > 0:
+                    from faster_whisper import BatchedInferencePipeline
+
+                    model = BatchedInferencePipeline(model)
+                self._model = model
             except ImportError:
                 raise AudioTranscriptionError(
                     "faster-whisper not installed. "
@@ -61,11 +122,15 @@ class WhisperAudioTranscriber:
 
         return self._model
 
-    def transcribe_audio(self, audio_path: str) -> list[AudioSegment]:
+    def transcribe_audio(self, audio_path: str | np.ndarray) -> list[AudioSegment]:
         """Transcribe audio using Whisper.
 
         Args:
-            audio_path: Path to audio file (WAV format recommended)
+            audio_path: Path to audio file (WAV format recommended), or mono
+                       float32 samples at 16kHz such as those returned by
+                       FFmpegAudioExtractor.extract_audio_array. Samples
+                       carry no format information, so any other layout or
+                       rate is misread.
 
         Returns:
             List of AudioSegment objects with timestamps and transcribed text
@@ -74,7 +139,7 @@ class WhisperAudioTranscriber:
             AudioTranscriptionError: If transcription fails
         """
         # Verify file exists
-        if not Path(audio_path).exists():
+        if not isinstance(audio_path, np.ndarray) and not Path(audio_path).exists():
             raise AudioTranscriptionError(
                 f"Audio file not found: {audio_path}"
             )
@@ -83,11 +148,19 @@ class WhisperAudioTranscriber:
             # Load model (lazy)
             model = self._load_model()
 
+            # Batched inference splits the audio on VAD-detected speech and
+            # decodes the chunks together
+            batch_options = {}
+            if self.batch_size > 0:
+                batch_options = {"batch_size": self.batch_size, "vad_filter": True}
+
             # Transcribe audio
             segments_iter, info = model.transcribe(
                 audio_path,
                 beam_size=self.beam_size,
-                word_timestamps=False  # Segment-level timestamps only
+                condition_on_previous_text=self.condition_on_previous_text,
+                word_timestamps=False,  # Segment-level timestamps only
+                **batch_options
             )
 
             # Convert to AudioSegment objects
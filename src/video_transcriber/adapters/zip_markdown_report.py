@@ -1,21 +1,50 @@
 """Zip Markdown Report Generator - creates zip files with markdown transcripts and images."""
+import io
+import os
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
-from video_transcriber.domain.models import TranscriptResult
+import numpy as np
+
+from video_transcriber.domain.models import FrameResult, TranscriptResult
 
 
 class ZipMarkdownReportGenerator:
     """Generates a zip file containing markdown transcript and frame images."""
 
-    def __init__(self, include_timestamps: bool = False):
+    def __init__(
+        self,
+        include_timestamps: bool = False,
+        png_compression: int = 1,
+        image_format: str = "png",
+        jpeg_quality: int = 85
+    ):
         """
         Initialize the report generator.
 
         Args:
             include_timestamps: Whether to include timestamps in the markdown output.
                               Defaults to False (timestamps excluded).
+            png_compression: PNG compression level from 0 to 9 for frame images.
+                           Defaults to 1 (fast); higher levels trade speed for size.
+            image_format: Frame image format, "png" (lossless, default) or
+                        "jpeg" (faster to encode and smaller, but lossy).
+            jpeg_quality: JPEG quality from 0 to 100 when image_format is "jpeg".
+                        Defaults to 85.
+
+        Raises:
+            ValueError: If image_format is not "png" or "jpeg"
         """
+        if image_format not in ("png", "jpeg"):
+            raise ValueError(f"Unsupported image format: {image_format}")
         self.include_timestamps = include_timestamps
+        self.png_compression = png_compression
+        self.image_format = image_format
+        self.jpeg_quality = jpeg_quality
+        self._image_extension = "jpg" if image_format == "jpeg" else "png"
 
     def generate(self, result: TranscriptResult, output_path: str) -> str:
         """
@@ -28,19 +57,102 @@ class ZipMarkdownReportGenerator:
         Returns:
             str: Path to the generated zip file
         """
-        # Create zip file
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        # Write through a 1 MiB buffer to batch the many small zip writes
+        with open(output_path, 'wb', buffering=1 << 20) as fp:
+            self.write(result, fp)
+
+        return output_path
+
+    def write(self, result: TranscriptResult, fileobj: BinaryIO) -> None:
+        """
+        Write the zip report to an open binary file object.
+
+        Args:
+            result: The TranscriptResult containing frames and audio segments
+            fileobj: Writable binary file object, such as an open file or io.BytesIO
+        """
+        # PNG and JPEG data are already compressed, so frame images are stored as-is
+        with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_STORED) as zf:
             # Save frame images
-            for i, frame in enumerate(result.frames):
-                image_filename = f"img/frame_{i:03d}.png"
-                image_bytes = frame.to_png_bytes()
-                zf.writestr(image_filename, image_bytes)
+            self._write_frame_images(zf, result.frames)
 
             # Generate and save markdown
             markdown = self._generate_markdown(result)
-            zf.writestr("transcript.md", markdown.encode('utf-8'))
+            zf.writestr(
+                "transcript.md",
+                markdown.encode('utf-8'),
+                compress_type=zipfile.ZIP_DEFLATED,
+                compresslevel=1
+            )
+
+    def _write_frame_images(self, zf: zipfile.ZipFile, frames: list[FrameResult]) -> None:
+        """
+        Encode frames in parallel and stream them into the zip in order.
 
-        return output_path
+        cv2 releases the GIL while encoding, so frames are encoded on a thread
+        pool. Only a small window of encoded frames is held in memory at once,
+        rather than every PNG in the report.
+
+        Args:
+            zf: Open zip file to write images into
+            frames: Frames to encode, written as img/frame_NNN.png (or .jpg)
+        """
+        workers = os.cpu_count() or 1
+        max_pending = 2 * workers
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, frame in enumerate(frames):
+                pending.append((i, executor.submit(self._encode_image, frame)))
+                if len(pending) > max_pending:
+                    index, future = pending.popleft()
+                    self._write_image(zf, index, future.result())
+
+            while pending:
+                index, future = pending.popleft()
+                self._write_image(zf, index, future.result())
+
+    def _encode_image(self, frame: FrameResult) -> np.ndarray:
+        """
+        Encode a frame in the configured image format.
+
+        Args:
+            frame: Frame to encode
+
+        Returns:
+            np.ndarray: uint8 buffer of encoded image data
+        """
+        if self.image_format == "jpeg":
+            return frame.encode_jpeg(self.jpeg_quality)
+        return frame.encode_png(self.png_compression)
+
+    def _image_path(self, index: int) -> str:
+        """
+        Build the path of a frame image inside the zip.
+
+        Args:
+            index: Frame index
+
+        Returns:
+            str: Image path, e.g. "img/frame_000.png"
+        """
+        return f"img/frame_{index:03d}.{self._image_extension}"
+
+    def _write_image(self, zf: zipfile.ZipFile, index: int, image: np.ndarray) -> None:
+        """
+        Write an encoded image buffer to the zip without copying it to bytes.
+
+        Args:
+            zf: Open zip file to write the image into
+            index: Frame index used in the image filename
+            image: uint8 buffer of encoded image data
+        """
+        info = zipfile.ZipInfo(self._image_path(index), date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_STORED
+        info.external_attr = 0o600 << 16
+        info.file_size = image.nbytes
+        with zf.open(info, 'w') as dest:
+            dest.write(image.data)
 
     def _generate_markdown(self, result: TranscriptResult) -> str:
         """
@@ -55,40 +167,43 @@ class ZipMarkdownReportGenerator:
         Returns:
             str: Markdown-formatted transcript
         """
-        lines = ["# Video Transcript\n"]
+        buffer = io.StringIO()
+        write = buffer.write
+        write("# Video Transcript\n\n")
 
         if not result.frames:
             # Audio-only mode: output audio segments without frame references
             if result.audio_segments:
                 return self._generate_audio_only_markdown(result.audio_segments)
-            lines.append("No frames extracted from video.\n")
-            return "\n".join(lines)
+            write("No frames extracted from video.\n")
+            return buffer.getvalue()
 
         for i, frame in enumerate(result.frames):
+            if i > 0:
+                write("\n")  # Blank line between slides
+
             # Frame header with optional timestamp
             if self.include_timestamps:
                 timestamp = self._format_timestamp(frame.timestamp_seconds)
-                lines.append(f"## Slide {i + 1} ({timestamp})\n")
+                write(f"## Slide {i + 1} ({timestamp})\n\n")
             else:
-                lines.append(f"## Slide {i + 1}\n")
+                write(f"## Slide {i + 1}\n\n")
 
             # Image link
-            lines.append(f"![Slide {i + 1}](img/frame_{i:03d}.png)\n")
+            write(f"![Slide {i + 1}]({self._image_path(i)})\n\n")
 
             # Audio segments associated with this frame
             if frame.audio_segments:
-                lines.append("**Audio:**\n")
+                write("**Audio:**\n\n")
                 for seg in frame.audio_segments:
                     if self.include_timestamps:
                         start = self._format_timestamp(seg.start_seconds)
                         end = self._format_timestamp(seg.end_seconds)
-                        lines.append(f"- [{start} - {end}] {seg.text}\n")
+                        write(f"- [{start} - {end}] {seg.text}\n\n")
                     else:
-                        lines.append(f"- {seg.text}\n")
-
-            lines.append("")  # Blank line between slides
+                        write(f"- {seg.text}\n\n")
 
-        return "\n".join(lines)
+        return buffer.getvalue()
 
     def _generate_audio_only_markdown(self, audio_segments: list) -> str:
         """
@@ -100,17 +215,20 @@ class ZipMarkdownReportGenerator:
         Returns:
             str: Markdown-formatted audio transcript
         """
-        lines = ["# Audio Transcript\n"]
+        buffer = io.StringIO()
+        write = buffer.write
+        write("# Audio Transcript\n")
 
         for seg in audio_segments:
+            write("\n")  # Blank line before each segment
             if self.include_timestamps:
                 start = self._format_timestamp(seg.start_seconds)
                 end = self._format_timestamp(seg.end_seconds)
-                lines.append(f"[{start} - {end}] {seg.text}\n")
+                write(f"[{start} - {end}] {seg.text}\n")
             else:
-                lines.append(f"{seg.text}\n")
+                write(f"{seg.text}\n")
 
-        return "\n".join(lines)
+        return buffer.getvalue()
 
     def _format_timestamp(self, seconds: float) -> str:
         """
@@ -122,6 +240,5 @@ class ZipMarkdownReportGenerator:
         Returns:
             str: Formatted timestamp (e.g., "1:23" or "12:05")
         """
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
         return f"{minutes}:{secs:02d}"
@@ -0,0 +1,89 @@
+"""Perceptual hashing for detecting visual changes between frames."""
+
+import cv2
+import numpy as np
+
+HASH_SIZE = 16  # Hash grid is HASH_SIZE x HASH_SIZE
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+
+def compute_frame_hash(image: np.ndarray, hash_size: int = HASH_SIZE) -> np.ndarray:
+    """Compute a perceptual hash for change detection.
+
+    Uses average hash - fast and effective for slide detection.
+    The hash is based on whether each pixel in a downsampled grayscale
+    version of the frame is above or below the mean value.
+
+    The bits are packed into uint64 words so that two hashes can be
+    compared with XOR and popcount rather than element by element.
+
+    Args:
+        image: Input frame as numpy array (BGR format)
+        hash_size: Size of hash grid (default 16x16 = 256 bits);
+                  hash_size * hash_size must be a multiple of 64
+
+    Returns:
+        uint64 array holding the packed perceptual hash bits
+    """
+    # Convert to grayscale
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    # Resize to hash_size x hash_size
+    resized = cv2.resize(gray, (hash_size, hash_size), interpolation=cv2.INTER_AREA)
+
+    # Compare each pixel to mean value. Pixels are integers, so comparing
+    # against the floored integer mean gives exactly the same bits as the
+    # float mean without a float64 reduction.
+    mean_val = resized.sum(dtype=np.uint32) // resized.size
+
+    # Pack the above/below-mean bits into 64-bit words
+    return np.packbits(resized > mean_val).view(np.uint64)
+
+
+def hamming_distance(hash1: np.ndarray, hash2: np.ndarray) -> int:
+    """Count the bits that differ between two packed perceptual hashes.
+
+    Args:
+        hash1: Packed hash from compute_frame_hash
+        hash2: Packed hash from compute_frame_hash
+
+    Returns:
+        Number of differing bits
+    """
+    # A single popcount over the XOR as one Python int avoids the
+    # intermediate arrays of unpacking to one byte per bit
+    return int.from_bytes(np.bitwise_xor(hash1, hash2).tobytes(), "little").bit_count()
+
+
+def hash_similarity(hash1: np.ndarray, hash2: np.ndarray) -> float:
+    """Compute similarity between two packed perceptual hashes.
+
+    Args:
+        hash1: Packed hash from compute_frame_hash
+        hash2: Packed hash from compute_frame_hash
+
+    Returns:
+        Similarity score from 0.0 (completely different) to 1.0 (identical)
+    """
+    return 1.0 - hamming_distance(hash1, hash2) / (hash1.size * 64)
+
+
+def max_distance_for_similarity(similarity_threshold: float, hash_bits: int = HASH_BITS) -> int:
+    """Find the largest Hamming distance that still meets a similarity threshold.
+
+    Lets callers compare integer bit counts instead of computing a float
+    similarity for every pair: hash_similarity(a, b) >= similarity_threshold
+    exactly when hamming_distance(a, b) <= the returned distance.
+
+    Args:
+        similarity_threshold: Minimum similarity (0-1)
+        hash_bits: Number of bits in each hash
+
+    Returns:
+        Maximum distance, or -1 if no distance meets the threshold
+    """
+    return max(
+        (distance for distance in range(hash_bits + 1)
+         if 1.0 - distance / hash_bits >= similarity_threshold),
+        default=-1
+    )
@@ -2,6 +2,7 @@
 
 from typing import Iterator
 
+from .frame_comparison import compute_frame_hash, hamming_distance, max_distance_for_similarity
 from .models import FrameResult
 from ..ports.video_reader import VideoReader, Frame
 
@@ -43,14 +44,21 @@ class FrameSelector:
         Yields:
             FrameResult objects for each distinct frame
         """
+        # Frames differ enough when more hash bits differ than this budget
+        max_distance = max_distance_for_similarity(self.similarity_threshold)
         last_captured_frame = Frame.initial_frame()
+        last_captured_hash = None
 
         for current_frame in self.video_reader.read_frames(video_path, sample_interval):
-            # Check if frame is sufficiently different
-            frames_differ_enough = current_frame.similarity_to(last_captured_frame) < self.similarity_threshold
-            frame_interval_is_enough = current_frame.frame_interval_to(last_captured_frame) >= self.min_frame_interval
+            # Check the cheap frame interval first, so frames too close to the
+            # last capture are skipped without computing their hash
+            if current_frame.frame_interval_to(last_captured_frame) < self.min_frame_interval:
+                continue
 
-            if frames_differ_enough and frame_interval_is_enough:
+            # Check if frame is sufficiently different
+            current_hash = compute_frame_hash(current_frame.image)
+            if last_captured_hash is None or hamming_distance(current_hash, last_captured_hash) > max_distance:
                 yield FrameResult(frame=current_frame)
 
                 last_captured_frame = current_frame
+                last_captured_hash = current_hash
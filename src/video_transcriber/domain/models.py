@@ -1,20 +1,16 @@
 """Domain models for video transcription."""
 
-import io
 from dataclasses import dataclass, field
-from typing import Optional
 import cv2
 import numpy as np
-from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Frame:
     """A single video frame with metadata."""
     frame_number: int
     timestamp_seconds: float
     image: np.ndarray | None  # BGR format (OpenCV convention), or None for initial frame
-    _hash: Optional[np.ndarray] = None  # Cached perceptual hash
 
     @classmethod
     def initial_frame(cls) -> 'Frame':
@@ -29,72 +25,72 @@ class Frame:
             image=None
         )
 
-    @staticmethod
-    def _compute_hash(image: np.ndarray, hash_size: int = 16) -> np.ndarray:
-        """Compute a perceptual hash for change detection.
-
-        Uses average hash - fast and effective for slide detection.
-        The hash is based on whether each pixel in a downsampled grayscale
-        version of the frame is above or below the mean value.
+    def frame_interval_to(self, other: 'Frame') -> int:
+        """Calculate the number of frames between this frame and another.
 
         Args:
-            image: Input frame as numpy array (BGR format)
-            hash_size: Size of hash grid (default 16x16 = 256 bits)
+            other: The frame to compare to
 
         Returns:
-            Boolean array representing the perceptual hash
+            Absolute difference in frame numbers
         """
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-        # Resize to hash_size x hash_size
-        resized = cv2.resize(gray, (hash_size, hash_size), interpolation=cv2.INTER_AREA)
-
-        # Compare each pixel to mean value
-        mean_val = resized.mean()
+        return abs(self.frame_number - other.frame_number)
 
-        # Return flattened boolean array
-        return (resized > mean_val).flatten()
+    def encode_png(self, compression: int = 1) -> np.ndarray:
+        """Encode frame image as PNG into a numpy byte buffer.
 
-    def get_hash(self) -> np.ndarray | None:
-        """Get perceptual hash for this frame, computing and caching if needed."""
-        if self.image is None:
-            return None
-        if self._hash is None:
-            self._hash = Frame._compute_hash(self.image)
-        return self._hash
-
-    def similarity_to(self, other: 'Frame') -> float:
-        """Compute similarity to another frame.
+        Unlike to_png_bytes, the encoded buffer is returned without copying
+        it into a bytes object, so it can be written straight to a file.
 
         Args:
-            other: The frame to compare to
+            compression: zlib compression level from 0 to 9 (default: 1).
+                        Slides are low-entropy images, so level 1 is nearly
+                        as small as higher levels at a fraction of the CPU.
 
         Returns:
-            Similarity score from 0.0 (completely different) to 1.0 (identical)
+            np.ndarray: uint8 buffer of PNG-encoded image data
+
+        Raises:
+            ValueError: If frame has no image (e.g., initial_frame)
         """
-        my_hash = self.get_hash()
-        other_hash = other.get_hash()
-        if my_hash is None or other_hash is None:
-            return 0.0
-        return float(np.mean(my_hash == other_hash))
+        if self.image is None:
+            raise ValueError("Cannot encode frame with no image")
 
-    def frame_interval_to(self, other: 'Frame') -> int:
-        """Calculate the number of frames between this frame and another.
+        # cv2.imencode expects BGR, so the image can be encoded as-is
+        params = [
+            cv2.IMWRITE_PNG_COMPRESSION, compression,
+            cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_FILTERED,
+        ]
+        ok, buffer = cv2.imencode(".png", self.image, params)
+        if not ok:
+            raise ValueError("Failed to encode frame as PNG")
+        return buffer
+
+    def to_png_bytes(self, compression: int = 1) -> bytes:
+        """Encode frame image as PNG bytes.
 
         Args:
-            other: The frame to compare to
+            compression: zlib compression level from 0 to 9 (default: 1)
 
         Returns:
-            Absolute difference in frame numbers
+            bytes: PNG-encoded image data
+
+        Raises:
+            ValueError: If frame has no image (e.g., initial_frame)
         """
-        return abs(self.frame_number - other.frame_number)
+        return self.encode_png(compression).tobytes()
 
-    def to_png_bytes(self) -> bytes:
-        """Encode frame image as PNG bytes.
+    def encode_jpeg(self, quality: int = 85) -> np.ndarray:
+        """Encode frame image as JPEG into a numpy byte buffer.
+
+        JPEG encodes much faster than PNG and gives smaller files for
+        photographic content, at the cost of some blurring around text.
+
+        Args:
+            quality: JPEG quality from 0 to 100 (default: 85)
 
         Returns:
-            bytes: PNG-encoded image data
+            np.ndarray: uint8 buffer of JPEG-encoded image data
 
         Raises:
             ValueError: If frame has no image (e.g., initial_frame)
@@ -102,20 +98,13 @@ class Frame:
         if self.image is None:
             raise ValueError("Cannot encode frame with no image")
 
-        # Convert BGR to RGB (OpenCV uses BGR by default)
-        if len(self.image.shape) == 3 and self.image.shape[2] == 3:
-            image_rgb = cv2.cvtColor(self.image, cv2.COLOR_BGR2RGB)
-        else:
-            image_rgb = self.image
-
-        # Convert to PIL Image and encode as PNG
-        pil_image = Image.fromarray(image_rgb)
-        buffer = io.BytesIO()
-        pil_image.save(buffer, format="PNG")
-        return buffer.getvalue()
+        ok, buffer = cv2.imencode(".jpg", self.image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("Failed to encode frame as JPEG")
+        return buffer
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
     """A segment of transcribed audio."""
     start_seconds: float
@@ -123,7 +112,7 @@ class AudioSegment:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameResult:
     """Holds a frame with timestamp and audio segments."""
     frame: Frame
@@ -144,12 +133,20 @@ class FrameResult:
         """Delegate to frame.image for backward compatibility."""
         return self.frame.image
 
-    def to_png_bytes(self) -> bytes:
+    def encode_png(self, compression: int = 1) -> np.ndarray:
+        """Encode frame image as a PNG byte buffer by delegating to frame."""
+        return self.frame.encode_png(compression)
+
+    def to_png_bytes(self, compression: int = 1) -> bytes:
         """Encode frame image as PNG bytes by delegating to frame."""
-        return self.frame.to_png_bytes()
+        return self.frame.to_png_bytes(compression)
+
+    def encode_jpeg(self, quality: int = 85) -> np.ndarray:
+        """Encode frame image as a JPEG byte buffer by delegating to frame."""
+        return self.frame.encode_jpeg(quality)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptResult:
     """Complete transcript with visual and audio components."""
     frames: list[FrameResult]
@@ -1,10 +1,10 @@
 """Core video transcription use case with dependency injection."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Iterator
 from pathlib import Path
 from dataclasses import dataclass
 import tempfile
-import os
 
 from .models import FrameResult, TranscriptResult, AudioSegment
 from .frame_selector import FrameSelector
@@ -26,6 +26,9 @@ class TranscriberConfig:
     """Configuration settings for VideoTranscriber."""
     similarity_threshold: float = 0.92
     min_frame_interval: int = 15
+    # Pass audio from extractor to transcriber as samples in memory instead
+    # of through a temporary WAV file; both audio ports must support it
+    in_memory_audio: bool = False
 
 
 class VideoTranscriber:
@@ -52,6 +55,7 @@ class VideoTranscriber:
         self.audio_transcriber = ports.audio_transcriber
         self.similarity_threshold = config.similarity_threshold
         self.min_frame_interval = config.min_frame_interval
+        self.in_memory_audio = config.in_memory_audio
 
         # Create frame selector with configured parameters
         self.frame_selector = FrameSelector(
@@ -82,7 +86,9 @@ class VideoTranscriber:
         """Extract and transcribe audio from video.
 
         Handles extraction, transcription, error handling, and cleanup of temp files.
-        Returns empty list if extraction or transcription fails.
+        With in_memory_audio, samples go straight to the transcriber and no
+        temp file is created. Returns empty list if extraction or
+        transcription fails.
 
         Args:
             video_path: Path to video file
@@ -91,21 +97,23 @@ class VideoTranscriber:
             List of audio segments with timestamps and text
         """
         audio_segments = []
-        audio_path = None
 
         try:
-            audio_path = self.audio_extractor.extract_audio(video_path)
-            audio_segments = self.audio_transcriber.transcribe_audio(audio_path)
+            if self.in_memory_audio:
+                samples = self.audio_extractor.extract_audio_array(video_path)
+                audio_segments = self.audio_transcriber.transcribe_audio(samples)
+            else:
+                # Extract into a directory created here, so cleanup only ever
+                # removes a file this method asked for
+                with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as audio_dir:
+                    audio_path = self.audio_extractor.extract_audio(
+                        video_path, output_path=str(Path(audio_dir) / "audio.wav")
+                    )
+                    audio_segments = self.audio_transcriber.transcribe_audio(audio_path)
         except AudioExtractionError as e:
             print(f"Warning: Audio extraction failed: {e}")
         except AudioTranscriptionError as e:
             print(f"Warning: Audio transcription failed: {e}")
-        finally:
-            if audio_path and audio_path.startswith(tempfile.gettempdir()):
-                try:
-                    os.remove(audio_path)
-                except (FileNotFoundError, PermissionError):
-                    pass
 
         return audio_segments
 
@@ -125,10 +133,7 @@ class VideoTranscriber:
         Returns:
             List of frame results
         """
-        frames = []
-        for frame_result in self.extract_distinct_frames(video_path, sample_interval):
-            frames.append(frame_result)
-        return frames
+        return list(self.extract_distinct_frames(video_path, sample_interval))
 
     def _merge_audio_with_frames(
         self,
@@ -150,21 +155,24 @@ class VideoTranscriber:
         if not audio_segments:
             return frames
 
+        # Walk frames and time-ordered segments together, so each segment
+        # is visited once. The first frame captures all audio from the
+        # start of the video.
+        segments = sorted(audio_segments, key=lambda seg: seg.start_seconds)
+        next_segment = 0
+
         for i, frame in enumerate(frames):
-            # Find time range for this frame
-            # First frame captures all audio from the start of the video
-            start_time = 0.0 if i == 0 else frame.timestamp_seconds
+            first_segment = next_segment
             if i + 1 < len(frames):
+                # Take segments that start before the next frame
                 end_time = frames[i + 1].timestamp_seconds
+                while next_segment < len(segments) and segments[next_segment].start_seconds < end_time:
+                    next_segment += 1
             else:
                 # Last frame: include all remaining audio
-                end_time = float('inf')
+                next_segment = len(segments)
 
-            # Find audio segments that start in this time range
-            frame.audio_segments = [
-                seg for seg in audio_segments
-                if start_time <= seg.start_seconds < end_time
-            ]
+            frame.audio_segments = segments[first_segment:next_segment]
 
         return frames
 
@@ -183,21 +191,29 @@ class VideoTranscriber:
             transcribe_audio: Whether to transcribe audio (requires audio ports)
             extract_frames: Whether to extract frames (set False for audio-only)
 
+        Audio extraction/transcription runs on a background thread while
+        frames are extracted, since the two share no resources.
+
         Returns:
             TranscriptResult with frames and audio segments
         """
-        # Extract and transcribe audio (if requested and adapters available)
-        audio_segments = []
-        if transcribe_audio and self.audio_extractor and self.audio_transcriber:
-            audio_segments = self._extract_and_transcribe_audio(video_path)
-
-        # Extract frames (unless audio-only mode)
-        frames = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Extract and transcribe audio (if requested and adapters available)
+            audio_future = None
+            if transcribe_audio and self.audio_extractor and self.audio_transcriber:
+                audio_future = executor.submit(self._extract_and_transcribe_audio, video_path)
+
+            # Extract frames (unless audio-only mode)
+            frames = []
+            if extract_frames:
+                frames = self._extract_and_transcribe_frames(
+                    video_path, sample_interval
+                )
+
+            audio_segments = audio_future.result() if audio_future else []
+
+        # Merge audio with frames based on timestamps
         if extract_frames:
-            frames = self._extract_and_transcribe_frames(
-                video_path, sample_interval
-            )
-            # Merge audio with frames based on timestamps
             frames = self._merge_audio_with_frames(frames, audio_segments)
 
         return TranscriptResult(frames=frames, audio_segments=audio_segments)
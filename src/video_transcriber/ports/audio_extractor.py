@@ -2,6 +2,12 @@
 
 from typing import Protocol
 
+import numpy as np
+
+
+# Sample rate of in-memory audio, the rate Whisper models expect
+AUDIO_ARRAY_SAMPLE_RATE = 16000
+
 
 class AudioExtractionError(Exception):
     """Raised when audio extraction from video fails."""
@@ -30,3 +36,21 @@ class AudioExtractor(Protocol):
             AudioExtractionError: If extraction fails
         """
         ...
+
+    def extract_audio_array(self, video_path: str) -> np.ndarray:
+        """Extract audio from video file straight into memory.
+
+        Avoids writing and re-reading a temporary file when the transcriber
+        can take samples directly.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Mono float32 samples at AUDIO_ARRAY_SAMPLE_RATE, scaled to [-1.0, 1.0)
+
+        Raises:
+            AudioExtractionError: If extraction fails, or the extractor is not
+                                 configured to produce mono audio at that rate
+        """
+        ...
@@ -1,6 +1,9 @@
 """Audio transcription port (protocol)."""
 
 from typing import Protocol
+
+import numpy as np
+
 from video_transcriber.domain.models import AudioSegment
 
 
@@ -16,11 +19,13 @@ class AudioTranscriber(Protocol):
     (e.g., Whisper) to convert audio to text segments.
     """
 
-    def transcribe_audio(self, audio_path: str) -> list[AudioSegment]:
+    def transcribe_audio(self, audio_path: str | np.ndarray) -> list[AudioSegment]:
         """Transcribe audio file to text with timestamps.
 
         Args:
-            audio_path: Path to audio file (typically WAV format)
+            audio_path: Path to audio file (typically WAV format), or mono
+                       float32 samples as returned by
+                       AudioExtractor.extract_audio_array
 
         Returns:
             List of AudioSegment objects with timestamps and transcribed text
@@ -3,10 +3,15 @@
 from pathlib import Path
 
 from video_transcriber.adapters.opencv_video import OpenCVVideoAdapter
+from video_transcriber.adapters.prefetching_video import PrefetchingVideoReader
 from video_transcriber.adapters.ffmpeg_audio import FFmpegAudioExtractor
 from video_transcriber.adapters.whisper_audio import WhisperAudioTranscriber
 from video_transcriber.adapters.zip_markdown_report import ZipMarkdownReportGenerator
-from video_transcriber.domain.video_transcriber import VideoTranscriber, TranscriberPorts
+from video_transcriber.domain.video_transcriber import (
+    VideoTranscriber,
+    TranscriberPorts,
+    TranscriberConfig
+)
 
 
 def transcribe_video(
@@ -40,7 +45,8 @@ def transcribe_video(
     output_zip = output_dir / f"{video_path.stem}_transcript.zip"
 
     # Create adapters
-    video_reader = OpenCVVideoAdapter()
+    # Decode frames ahead on a background thread while frames are compared
+    video_reader = PrefetchingVideoReader(OpenCVVideoAdapter())
     audio_extractor = FFmpegAudioExtractor()
     audio_transcriber = WhisperAudioTranscriber(model_size=model_size)
 
@@ -50,7 +56,11 @@ def transcribe_video(
         audio_extractor=audio_extractor,
         audio_transcriber=audio_transcriber
     )
-    transcriber = VideoTranscriber(ports=ports)
+    # ffmpeg pipes samples straight to Whisper, so no temporary WAV is written
+    transcriber = VideoTranscriber(
+        ports=ports,
+        config=TranscriberConfig(in_memory_audio=True)
+    )
 
     # Process the video
     result = transcriber.process_video(
@@ -0,0 +1,46 @@
+"""Shared pytest fixtures."""
+
+import numpy as np
+import pytest
+
+
+def _read_only(image):
+    """Mark a shared test image read-only so no test can change it for others."""
+    image.setflags(write=False)
+    return image
+
+
+def _left_right_split(value=255):
+    """Create an image with black left half and the given value on the right."""
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    image[:, 50:] = value
+    return _read_only(image)
+
+
+def _top_bottom_split():
+    """Create an image with black top half, white bottom half."""
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    image[50:, :] = 255
+    return _read_only(image)
+
+
+@pytest.fixture(scope="session")
+def canonical_frames():
+    """Read-only 100x100 BGR test images, built once per test session.
+
+    Keys:
+        black: all black
+        left_right: black left half, white right half
+        top_bottom: black top half, white bottom half
+        nearly_left_right: like left_right but 254 instead of 255
+        gray128: uniform mid gray
+
+    Use .copy() on an image before modifying it.
+    """
+    return {
+        "black": _read_only(np.zeros((100, 100, 3), dtype=np.uint8)),
+        "left_right": _left_right_split(),
+        "top_bottom": _top_bottom_split(),
+        "nearly_left_right": _left_right_split(254),
+        "gray128": _read_only(np.full((100, 100, 3), 128, dtype=np.uint8)),
+    }
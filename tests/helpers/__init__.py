@@ -2,9 +2,11 @@
 
 from .fake_audio import FakeAudioExtractor, FakeAudioTranscriber
 from .fake_video import FakeVideoReader
+from .frames import tiny_frame
 
 __all__ = [
     "FakeAudioExtractor",
     "FakeAudioTranscriber",
     "FakeVideoReader",
+    "tiny_frame",
 ]
@@ -1,6 +1,8 @@
 """Fake implementations of audio ports for testing."""
 
-from video_transcriber.ports.audio_extractor import AudioExtractionError
+import numpy as np
+
+from video_transcriber.ports.audio_extractor import AudioExtractionError, AUDIO_ARRAY_SAMPLE_RATE
 from video_transcriber.ports.audio_transcriber import AudioTranscriptionError
 from video_transcriber.domain.models import AudioSegment
 
@@ -50,6 +52,26 @@ class FakeAudioExtractor:
 
         return output_path or self.audio_file_path
 
+    def extract_audio_array(self, video_path: str) -> np.ndarray:
+        """Return one second of silence without actual extraction.
+
+        Args:
+            video_path: Path to video (stored but not used)
+
+        Returns:
+            Mono float32 samples at AUDIO_ARRAY_SAMPLE_RATE
+
+        Raises:
+            AudioExtractionError: If should_fail is True
+        """
+        self.call_count += 1
+        self.last_video_path = video_path
+
+        if self.should_fail:
+            raise AudioExtractionError("Fake extraction failure")
+
+        return np.zeros(AUDIO_ARRAY_SAMPLE_RATE, dtype=np.float32)
+
 
 class FakeAudioTranscriber:
     """Fake audio transcriber for testing without actual transcription.
@@ -84,23 +106,21 @@ class FakeAudioTranscriber:
         Returns:
             FakeAudioTranscriber with sequential audio segments
         """
-        segments = []
-        current_time = 0.0
-        for text in texts:
-            segment = AudioSegment(
-                start_seconds=current_time,
-                end_seconds=current_time + segment_duration,
+        segments = [
+            AudioSegment(
+                start_seconds=i * segment_duration,
+                end_seconds=(i + 1) * segment_duration,
                 text=text
             )
-            segments.append(segment)
-            current_time += segment_duration
+            for i, text in enumerate(texts)
+        ]
         return cls(segments=segments)
 
-    def transcribe_audio(self, audio_path: str) -> list[AudioSegment]:
+    def transcribe_audio(self, audio_path: str | np.ndarray) -> list[AudioSegment]:
         """Return configured segments without actual transcription.
 
         Args:
-            audio_path: Path to audio (stored but not used)
+            audio_path: Path to audio or in-memory samples (stored but not used)
 
         Returns:
             Configured list of AudioSegment objects
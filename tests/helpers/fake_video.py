@@ -1,7 +1,8 @@
 """Fake implementation of VideoReader for testing."""
 
 import sys
-from typing import Iterator, Optional
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
 
 from video_transcriber.ports.video_reader import VideoMetadata, Frame
 
@@ -15,13 +16,15 @@ class FakeVideoReader:
     def __init__(
         self,
         metadata: VideoMetadata,
-        frames: list[Frame]
+        frames: Iterable[Frame] | Callable[[], Iterable[Frame]]
     ):
         """Initialize the fake video reader.
 
         Args:
             metadata: Video metadata to return
-            frames: List of frames to yield when read_frames is called
+            frames: Frames to yield when read_frames is called, either as a
+                   collection or as a function returning a fresh iterable for
+                   each call, so long videos can be generated lazily
         """
         self.metadata = metadata
         self.frames = frames
@@ -55,15 +58,10 @@ class FakeVideoReader:
             limit: Maximum number of frames to yield (default: unlimited)
 
         Yields:
-            Frame objects from the configured list
+            Frame objects from the configured frames
         """
         self.call_count += 1
         self.last_video_path = video_path
 
-        yielded_count = 0
-        for i, frame in enumerate(self.frames):
-            if i % sample_interval == 0:
-                yield frame
-                yielded_count += 1
-                if yielded_count >= limit:
-                    break
\ No newline at end of file
+        frames = self.frames() if callable(self.frames) else self.frames
+        yield from islice(islice(frames, 0, None, sample_interval), limit)
@@ -0,0 +1,18 @@
+"""Helpers for building test frames."""
+
+import numpy as np
+
+from video_transcriber.domain.models import Frame
+
+
+def tiny_frame(frame_number: int = 0, timestamp_seconds: float = 0.0) -> Frame:
+    """Create a small black Frame for tests that never look at the pixels.
+
+    Args:
+        frame_number: Frame number to give the frame
+        timestamp_seconds: Timestamp to give the frame
+
+    Returns:
+        Frame holding an 8x8 BGR image
+    """
+    return Frame(frame_number, timestamp_seconds, np.zeros((8, 8, 3), dtype=np.uint8))
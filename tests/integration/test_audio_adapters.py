@@ -6,6 +6,9 @@ These tests require:
 - faster-whisper installed
 """
 
+import asyncio
+
+import numpy as np
 import pytest
 import tempfile
 from pathlib import Path
@@ -83,6 +86,75 @@ class TestFFmpegAudioExtractor:
             assert output_path.stat().st_size > 0
 
 
+    def test_extracts_audio_asynchronously(self):
+        """FFmpegAudioExtractor can extract audio from within an event loop."""
+        extractor = FFmpegAudioExtractor()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "output.wav"
+
+            result = asyncio.run(extractor.extract_audio_async(
+                str(TEST_VIDEO),
+                output_path=str(output_path)
+            ))
+
+            assert result == str(output_path)
+            assert output_path.stat().st_size > 0
+
+    def test_async_extraction_raises_error_for_invalid_video(self):
+        """Async extraction reports failures with AudioExtractionError."""
+        extractor = FFmpegAudioExtractor()
+
+        with pytest.raises(AudioExtractionError):
+            asyncio.run(extractor.extract_audio_async("nonexistent_video.mp4"))
+
+    def test_cancelled_async_extraction_stops_ffmpeg(self, monkeypatch):
+        """Cancelling async extraction kills the ffmpeg process rather than leaving it running."""
+        extractor = FFmpegAudioExtractor()
+        processes = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def record_process(*args, **kwargs):
+            process = await create_subprocess_exec(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", record_process)
+
+        async def cancel_extraction(output_path):
+            task = asyncio.ensure_future(
+                extractor.extract_audio_async(str(TEST_VIDEO), output_path=output_path)
+            )
+            while not processes:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            asyncio.run(cancel_extraction(str(Path(tmpdir) / "output.wav")))
+
+        assert processes[0].returncode is not None
+
+    def test_extracts_audio_as_array(self):
+        """FFmpegAudioExtractor can stream audio into memory without a file."""
+        extractor = FFmpegAudioExtractor()
+
+        samples = extractor.extract_audio_array(str(TEST_VIDEO))
+
+        assert isinstance(samples, np.ndarray)
+        assert samples.dtype == np.float32
+        assert len(samples) > 0
+        assert np.abs(samples).max() <= 1.0
+
+    def test_array_extraction_rejects_non_whisper_format(self):
+        """In-memory samples must be mono 16kHz, as raw PCM has no header."""
+        extractor = FFmpegAudioExtractor(sample_rate=44100, channels=2)
+
+        with pytest.raises(AudioExtractionError):
+            extractor.extract_audio_array(str(TEST_VIDEO))
+
+
 class TestWhisperAudioTranscriber:
     """Integration tests for Whisper audio transcription."""
 
@@ -128,6 +200,51 @@ class TestWhisperAudioTranscriber:
         finally:
             Path(audio_path).unlink()
 
+    def test_transcribes_audio_array(self):
+        """WhisperAudioTranscriber accepts in-memory samples instead of a path."""
+        extractor = FFmpegAudioExtractor()
+        samples = extractor.extract_audio_array(str(TEST_VIDEO))
+
+        transcriber = WhisperAudioTranscriber(model_size="tiny")
+        segments = transcriber.transcribe_audio(samples)
+
+        assert isinstance(segments, list)
+        assert len(segments) > 0
+
+    def test_transcribes_with_batched_inference(self):
+        """WhisperAudioTranscriber can batch speech chunks during decoding."""
+        extractor = FFmpegAudioExtractor()
+        audio_path = extractor.extract_audio(str(TEST_VIDEO))
+
+        try:
+            transcriber = WhisperAudioTranscriber(model_size="tiny", batch_size=4)
+            segments = transcriber.transcribe_audio(audio_path)
+
+            assert isinstance(segments, list)
+            assert len(segments) > 0
+        finally:
+            Path(audio_path).unlink()
+
+    def test_auto_compute_type_uses_int8_on_cpu(self):
+        """WhisperAudioTranscriber quantizes to int8 by default on CPU."""
+        transcriber = WhisperAudioTranscriber(model_size="tiny", device="cpu")
+
+        assert transcriber._resolve_compute_type() == "int8"
+
+    def test_uses_greedy_decoding_by_default(self):
+        """WhisperAudioTranscriber defaults to the fast greedy preset."""
+        transcriber = WhisperAudioTranscriber(model_size="tiny")
+
+        assert transcriber.beam_size == 1
+        assert transcriber.condition_on_previous_text is False
+
+    def test_accurate_preset_uses_beam_search(self):
+        """The accurate preset restores beam search and text conditioning."""
+        transcriber = WhisperAudioTranscriber(model_size="tiny", quality_preset="accurate")
+
+        assert transcriber.beam_size == 5
+        assert transcriber.condition_on_previous_text is True
+
     def test_raises_error_for_nonexistent_audio(self):
         """WhisperAudioTranscriber raises error for nonexistent audio file."""
         transcriber = WhisperAudioTranscriber(model_size="tiny")
@@ -3,6 +3,10 @@
 These tests require a test video file to be present.
 """
 
+import os
+import shutil
+import subprocess
+
 import numpy as np
 import pytest
 from pathlib import Path
@@ -34,18 +38,39 @@ class TestOpenCVVideoAdapter:
         expected_duration = metadata.total_frames / metadata.fps
         assert abs(metadata.duration_seconds - expected_duration) < 0.1
 
+    def test_caches_metadata_until_file_changes(self, tmp_path):
+        """Repeated metadata lookups reuse the cached result until the file is modified."""
+        video = tmp_path / "video.mp4"
+        shutil.copyfile(TEST_VIDEO, video)
+        adapter = OpenCVVideoAdapter()
+
+        first = adapter.get_metadata(str(video))
+        second = adapter.get_metadata(str(video))
+        stat = video.stat()
+        os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        after_change = adapter.get_metadata(str(video))
+
+        assert second is first
+        assert after_change is not first
+        assert after_change == first
+
     def test_reads_frames_from_video(self):
         """OpenCVVideoAdapter can read frames from video."""
         adapter = OpenCVVideoAdapter()
 
-        frames = list(adapter.read_frames(str(TEST_VIDEO), sample_interval=30, limit=10))
+        # Keep only the first frame rather than holding every decoded image
+        first_frame = None
+        frame_count = 0
+        for frame in adapter.read_frames(str(TEST_VIDEO), sample_interval=30, limit=10):
+            if first_frame is None:
+                first_frame = frame
+            frame_count += 1
 
         # Should yield at least some frames
-        assert len(frames) > 0
-        assert len(frames) <= 10  # Should respect limit
+        assert frame_count > 0
+        assert frame_count <= 10  # Should respect limit
 
         # Check first frame properties
-        first_frame = frames[0]
         assert first_frame.frame_number >= 0
         assert first_frame.timestamp_seconds >= 0
         assert isinstance(first_frame.image, np.ndarray)
@@ -59,16 +84,68 @@ class TestOpenCVVideoAdapter:
 
         # Read with different intervals to show sampling effect
         # Keep limits low for fast tests
-        frames_all = list(adapter.read_frames(str(TEST_VIDEO), sample_interval=1, limit=20))
-        frames_sampled = list(adapter.read_frames(str(TEST_VIDEO), sample_interval=10, limit=2))
+        # Only frame numbers are needed, so decoded images are not retained
+        numbers_all = [f.frame_number for f in adapter.read_frames(str(TEST_VIDEO), sample_interval=1, limit=20)]
+        numbers_sampled = [f.frame_number for f in adapter.read_frames(str(TEST_VIDEO), sample_interval=10, limit=2)]
 
         # Should respect the limits
-        assert len(frames_all) == 20
-        assert len(frames_sampled) == 2
+        assert len(numbers_all) == 20
+        assert len(numbers_sampled) == 2
         # Verify sampling: frames_sampled should be every 10th frame
         # So frame numbers should be 10, 20
-        assert frames_sampled[0].frame_number == 10
-        assert frames_sampled[1].frame_number == 20
+        assert numbers_sampled == [10, 20]
+
+    def test_seeks_to_sparse_samples(self):
+        """Intervals of a second or more are read by seeking, with the same numbering."""
+        adapter = OpenCVVideoAdapter()
+        metadata = adapter.get_metadata(str(TEST_VIDEO))
+
+        frame_numbers = []
+        for frame in adapter.read_frames(str(TEST_VIDEO), sample_interval=900):
+            assert frame.image.shape == (metadata.height, metadata.width, 3)
+            assert frame.timestamp_seconds == pytest.approx(frame.frame_number / metadata.fps)
+            frame_numbers.append(frame.frame_number)
+
+        assert frame_numbers == list(range(900, metadata.total_frames + 1, 900))
+
+    def test_seeked_frames_match_sequential_frames(self):
+        """Seeking yields the same images as decoding every frame, not just the same numbers."""
+        adapter = OpenCVVideoAdapter()
+
+        # An interval of 300 is read by seeking and 50 sequentially; frame
+        # 2100 is one that a frame-number seek lands a frame short of
+        seeked = list(adapter.read_frames(str(TEST_VIDEO), sample_interval=300, limit=8))
+        sequential = [
+            frame for frame in adapter.read_frames(str(TEST_VIDEO), sample_interval=50, limit=48)
+            if frame.frame_number % 300 == 0
+        ]
+
+        assert_same_frames(seeked, sequential)
+
+    @pytest.mark.parametrize("frame_filter", [
+        # Two frames missing, so later frames are a frame later than their
+        # number suggests; detected before reading and read sequentially
+        "select='not(between(n,200,201))'",
+        # A two second hole followed by frames at double rate, ending where
+        # evenly spaced frames would; seeks into the hole overshoot, and the
+        # rest of the video is read sequentially
+        "settb=1/600,setpts='if(lt(N,200),N,if(lt(N,320),260+(N-200)/2,N))/(30*TB)'",
+    ])
+    def test_frames_match_with_uneven_timestamps(self, tmp_path, frame_filter):
+        """Frames are numbered by position in the video even where timestamps say otherwise."""
+        video_path = make_numbered_video(tmp_path, frame_filter)
+        adapter = OpenCVVideoAdapter()
+        interval = 90
+        assert interval >= 2 * adapter.get_metadata(video_path).fps
+
+        sparse = list(adapter.read_frames(video_path, sample_interval=interval))
+        dense = [
+            frame for frame in adapter.read_frames(video_path, sample_interval=interval // 3)
+            if frame.frame_number % interval == 0
+        ]
+
+        assert len(sparse) == 600 // interval
+        assert_same_frames(sparse, dense)
 
     def test_raises_error_for_nonexistent_file(self):
         """OpenCVVideoAdapter raises error for nonexistent video file."""
@@ -79,3 +156,26 @@ class TestOpenCVVideoAdapter:
 
         with pytest.raises(VideoReadError):
             list(adapter.read_frames("nonexistent_video.mp4"))
+
+
+def make_numbered_video(directory: Path, frame_filter: str) -> str:
+    """Make a 20 second 30 fps clip in which every frame looks different."""
+    video_path = directory / "numbered.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=size=320x240:rate=30:duration=20",
+            "-vf", frame_filter, "-fps_mode", "passthrough", str(video_path)
+        ],
+        check=True
+    )
+    return str(video_path)
+
+
+def assert_same_frames(actual, expected):
+    """Check two frame lists have the same numbers and identical images."""
+    assert [frame.frame_number for frame in actual] == [frame.frame_number for frame in expected]
+    for actual_frame, expected_frame in zip(actual, expected):
+        assert np.array_equal(actual_frame.image, expected_frame.image), (
+            f"frame {actual_frame.frame_number} differs"
+        )
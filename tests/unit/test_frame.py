@@ -0,0 +1,57 @@
+"""Tests for the Frame model."""
+
+import cv2
+import numpy as np
+import pytest
+
+from video_transcriber.domain.models import Frame
+
+
+class TestFramePngEncoding:
+    """Tests for Frame PNG encoding."""
+
+    def test_png_bytes_round_trip_preserves_bgr_image(self):
+        """Decoding the PNG gives back the original BGR pixels."""
+        image = np.zeros((8, 8, 3), dtype=np.uint8)
+        image[:, :, 0] = 255  # Blue channel only
+        frame = Frame(0, 0.0, image)
+
+        png_bytes = frame.to_png_bytes()
+        decoded = cv2.imdecode(np.frombuffer(png_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+        assert png_bytes.startswith(b"\x89PNG")
+        assert np.array_equal(decoded, image)
+
+    def test_png_compression_level_does_not_change_pixels(self, canonical_frames):
+        """Fast and maximum compression decode to the same image."""
+        frame = Frame(0, 0.0, canonical_frames["left_right"])
+
+        fast = cv2.imdecode(np.frombuffer(frame.to_png_bytes(1), dtype=np.uint8), cv2.IMREAD_COLOR)
+        small = cv2.imdecode(np.frombuffer(frame.to_png_bytes(9), dtype=np.uint8), cv2.IMREAD_COLOR)
+
+        assert np.array_equal(fast, small)
+
+    def test_png_encoding_rejects_frame_without_image(self):
+        """The initial frame has no image to encode."""
+        with pytest.raises(ValueError):
+            Frame.initial_frame().to_png_bytes()
+
+
+class TestFrameJpegEncoding:
+    """Tests for Frame JPEG encoding."""
+
+    def test_jpeg_round_trip_approximates_bgr_image(self, canonical_frames):
+        """Decoding the JPEG gives back nearly the original BGR pixels."""
+        frame = Frame(0, 0.0, canonical_frames["left_right"])
+
+        jpeg = frame.encode_jpeg()
+        decoded = cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+
+        assert jpeg.tobytes().startswith(b"\xff\xd8")
+        assert decoded.shape == frame.image.shape
+        assert np.abs(decoded.astype(int) - frame.image).mean() < 5
+
+    def test_jpeg_encoding_rejects_frame_without_image(self):
+        """The initial frame has no image to encode."""
+        with pytest.raises(ValueError):
+            Frame.initial_frame().encode_jpeg()
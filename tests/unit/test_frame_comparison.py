@@ -0,0 +1,42 @@
+"""Tests for perceptual frame hashing and similarity."""
+
+import numpy as np
+
+from video_transcriber.domain.frame_comparison import (
+    HASH_BITS,
+    compute_frame_hash,
+    hash_similarity,
+    max_distance_for_similarity,
+)
+
+
+class TestFrameComparison:
+    """Tests for frame hash computation and comparison."""
+
+    def test_hash_is_packed_into_uint64_words(self, canonical_frames):
+        """A 16x16 hash is stored as four 64-bit words."""
+        frame_hash = compute_frame_hash(canonical_frames["left_right"])
+
+        assert frame_hash.dtype == np.uint64
+        assert frame_hash.shape == (4,)
+
+    def test_identical_images_are_fully_similar(self, canonical_frames):
+        """Images with the same content have similarity 1.0."""
+        hash1 = compute_frame_hash(canonical_frames["left_right"])
+        hash2 = compute_frame_hash(canonical_frames["left_right"].copy())
+
+        assert hash_similarity(hash1, hash2) == 1.0
+
+    def test_inverted_images_are_completely_different(self, canonical_frames):
+        """Every hash bit differs when black and white are swapped."""
+        image = canonical_frames["left_right"].copy()
+
+        assert hash_similarity(compute_frame_hash(image), compute_frame_hash(255 - image)) == 0.0
+
+    def test_distance_budget_matches_similarity_threshold(self):
+        """Distance within the budget is exactly similarity at or above threshold."""
+        for threshold in (0.0, 0.5, 0.75, 0.92, 0.98, 1.0):
+            max_distance = max_distance_for_similarity(threshold)
+            for distance in range(HASH_BITS + 1):
+                meets_threshold = 1.0 - distance / HASH_BITS >= threshold
+                assert (distance <= max_distance) == meets_threshold
@@ -0,0 +1,70 @@
+"""Tests for PrefetchingVideoReader."""
+
+import threading
+
+import pytest
+
+from video_transcriber.adapters.prefetching_video import PrefetchingVideoReader
+from video_transcriber.ports.video_reader import VideoMetadata, VideoReadError
+from tests.helpers.fake_video import FakeVideoReader
+from tests.helpers.frames import tiny_frame
+
+
+def make_frames(count):
+    """Create small frames numbered 0..count-1."""
+    return [tiny_frame(i, i / 30.0) for i in range(count)]
+
+
+class TestPrefetchingVideoReader:
+    """Tests for the background-decoding VideoReader decorator."""
+
+    def test_yields_frames_from_wrapped_reader_in_order(self):
+        """Frames come through unchanged and in order."""
+        metadata = VideoMetadata(640, 480, 30.0, 20, 0.67)
+        reader = PrefetchingVideoReader(
+            FakeVideoReader(metadata=metadata, frames=make_frames(20)),
+            max_queued=2
+        )
+
+        frame_numbers = [frame.frame_number for frame in reader.read_frames("dummy.mp4", sample_interval=3)]
+
+        assert frame_numbers == [0, 3, 6, 9, 12, 15, 18]
+        assert reader.get_metadata("dummy.mp4") == metadata
+
+    def test_stops_background_thread_when_consumer_stops(self):
+        """Closing the iterator early lets the decode thread finish."""
+        decoded = []
+
+        def lazy_frames():
+            for i in range(100):
+                decoded.append(i)
+                yield tiny_frame(i, i / 30.0)
+
+        reader = PrefetchingVideoReader(
+            FakeVideoReader(metadata=VideoMetadata(640, 480, 30.0, 100, 3.3), frames=lazy_frames),
+            max_queued=1
+        )
+        threads_before = threading.active_count()
+
+        frames = reader.read_frames("dummy.mp4")
+        first = next(frames)
+        frames.close()
+
+        assert first.frame_number == 0
+        assert threading.active_count() == threads_before
+        # The first frame, one queued frame and one waiting for room
+        assert len(decoded) <= 3
+
+    def test_raises_errors_from_wrapped_reader(self):
+        """Errors on the decode thread surface in the consumer."""
+        class FailingVideoReader(FakeVideoReader):
+            def read_frames(self, video_path, sample_interval=1, limit=None):
+                raise VideoReadError(f"Could not open video: {video_path}")
+                yield
+
+        reader = PrefetchingVideoReader(
+            FailingVideoReader(metadata=VideoMetadata(640, 480, 30.0, 0, 0.0), frames=[])
+        )
+
+        with pytest.raises(VideoReadError):
+            list(reader.read_frames("missing.mp4"))
@@ -1,6 +1,5 @@
 """Tests for VideoTranscriber use case with dependency injection."""
 
-import numpy as np
 import pytest
 
 from video_transcriber.domain.video_transcriber import (
@@ -8,33 +7,29 @@ from video_transcriber.domain.video_transcriber import (
     TranscriberPorts,
     TranscriberConfig
 )
+from video_transcriber.domain import frame_selector
+from video_transcriber.domain.frame_comparison import compute_frame_hash
 from video_transcriber.domain.models import AudioSegment
 from video_transcriber.ports.video_reader import VideoMetadata, Frame
 from tests.helpers.fake_video import FakeVideoReader
 
 
-@pytest.fixture
-def left_right_split_frame():
+@pytest.fixture(scope="module")
+def left_right_split_frame(canonical_frames):
     """Create a Frame with black left half, white right half."""
-    image = np.zeros((100, 100, 3), dtype=np.uint8)
-    image[:, 50:] = 255  # Left black, right white
-    return Frame(0, 0.0, image)
+    return Frame(0, 0.0, canonical_frames["left_right"])
 
 
-@pytest.fixture
-def top_bottom_split_frame():
+@pytest.fixture(scope="module")
+def top_bottom_split_frame(canonical_frames):
     """Create a Frame with black top half, white bottom half."""
-    image = np.zeros((100, 100, 3), dtype=np.uint8)
-    image[50:, :] = 255  # Top black, bottom white
-    return Frame(50, 1.67, image)
+    return Frame(50, 1.67, canonical_frames["top_bottom"])
 
 
-@pytest.fixture
-def almost_left_right_split_frame():
+@pytest.fixture(scope="module")
+def almost_left_right_split_frame(canonical_frames):
     """Create a Frame almost identical to left_right_split (254 instead of 255)."""
-    image = np.zeros((100, 100, 3), dtype=np.uint8)
-    image[:, 50:] = 254  # Almost identical to left_right_split
-    return Frame(10, 0.33, image)
+    return Frame(10, 0.33, canonical_frames["nearly_left_right"])
 
 
 class TestVideoTranscriberUseCase:
@@ -96,3 +91,34 @@ class TestVideoTranscriberUseCase:
 
         # frame2 should be filtered out as too similar to frame1
         assert len(result.frames) >= 2  # At least frame1 and frame3
+
+    def test_skips_hashing_frames_within_min_interval(self, monkeypatch, left_right_split_frame, almost_left_right_split_frame, top_bottom_split_frame):
+        """Frames too close to the last capture are rejected before hashing."""
+        hashed_images = []
+
+        def recording_hash(image):
+            hashed_images.append(image)
+            return compute_frame_hash(image)
+
+        monkeypatch.setattr(frame_selector, "compute_frame_hash", recording_hash)
+
+        # Frame 10 is within 15 frames of frame 0, frame 50 is not
+        fake_video = FakeVideoReader(
+            metadata=VideoMetadata(640, 480, 30.0, 90, 3.0),
+            frames=[left_right_split_frame, almost_left_right_split_frame, top_bottom_split_frame]
+        )
+
+        ports = TranscriberPorts(
+            video_reader=fake_video
+        )
+        config = TranscriberConfig(
+            similarity_threshold=0.92,
+            min_frame_interval=15
+        )
+        transcriber = VideoTranscriber(ports=ports, config=config)
+
+        result = transcriber.process_video("dummy.mp4", sample_interval=1)
+
+        assert [fr.frame_number for fr in result.frames] == [0, 50]
+        assert len(hashed_images) == 2
+        assert all(image is not almost_left_right_split_frame.image for image in hashed_images)
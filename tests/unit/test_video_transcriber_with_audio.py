@@ -1,5 +1,8 @@
 """Tests for VideoTranscriber with audio transcription support."""
 
+import threading
+from pathlib import Path
+
 import numpy as np
 import pytest
 
@@ -11,6 +14,7 @@ from video_transcriber.domain.video_transcriber import (
 from video_transcriber.domain.models import AudioSegment, FrameResult
 from video_transcriber.ports.video_reader import VideoMetadata, Frame
 from tests.helpers.fake_video import FakeVideoReader
+from tests.helpers.frames import tiny_frame
 from tests.helpers.fake_audio import FakeAudioExtractor, FakeAudioTranscriber
 from video_transcriber.ports.audio_extractor import AudioExtractionError
 from video_transcriber.ports.audio_transcriber import AudioTranscriptionError
@@ -57,8 +61,8 @@ class TestVideoTranscriberWithAudio:
     def test_process_video_extracts_and_transcribes_audio(self):
         """VideoTranscriber uses audio ports to extract and transcribe audio."""
         # Setup frames
-        frame1 = Frame(0, 0.0, np.zeros((100, 100, 3), dtype=np.uint8))
-        frame2 = Frame(30, 1.0, np.ones((100, 100, 3), dtype=np.uint8) * 128)
+        frame1 = tiny_frame(0, 0.0)
+        frame2 = tiny_frame(30, 1.0)
 
         fake_video = FakeVideoReader(
             metadata=VideoMetadata(640, 480, 30.0, 60, 2.0),
@@ -88,7 +92,7 @@ class TestVideoTranscriberWithAudio:
 
         # Should have transcribed audio
         assert fake_audio_transcriber.call_count == 1
-        assert fake_audio_transcriber.last_audio_path == "/tmp/test_audio.wav"
+        assert fake_audio_transcriber.last_audio_path == fake_audio_extractor.last_output_path
 
         # Should return audio segments in result
         assert len(result.audio_segments) == 2
@@ -97,7 +101,7 @@ class TestVideoTranscriberWithAudio:
 
     def test_can_skip_audio_transcription_with_flag(self):
         """VideoTranscriber can skip audio even when audio ports available."""
-        frame1 = Frame(0, 0.0, np.zeros((100, 100, 3), dtype=np.uint8))
+        frame1 = tiny_frame(0, 0.0)
 
         fake_video = FakeVideoReader(
             metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
@@ -127,16 +131,12 @@ class TestVideoTranscriberWithAudio:
         # No audio segments
         assert len(result.audio_segments) == 0
 
-    def test_merges_audio_segments_with_frames_by_timestamp(self):
+    def test_merges_audio_segments_with_frames_by_timestamp(self, canonical_frames):
         """VideoTranscriber associates audio segments with frames based on timestamps."""
         # Create 3 visually distinct frames at different timestamps
-        frame1_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        frame1_img[:, 50:] = 255  # Left/right split
-
-        frame2_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        frame2_img[50:, :] = 255  # Top/bottom split
-
-        frame3_img = np.ones((100, 100, 3), dtype=np.uint8) * 128  # Uniform gray
+        frame1_img = canonical_frames["left_right"]
+        frame2_img = canonical_frames["top_bottom"]
+        frame3_img = canonical_frames["gray128"]
 
         frame1 = Frame(0, 0.0, frame1_img)
         frame2 = Frame(300, 10.0, frame2_img)
@@ -186,9 +186,44 @@ class TestVideoTranscriberWithAudio:
         assert len(frame3_audio) == 1
         assert frame3_audio[0].text == "Audio during frame 3"
 
+    def test_merges_audio_segments_given_out_of_order(self, canonical_frames):
+        """Audio segments are assigned by start time even if not sorted."""
+        frame1_img = canonical_frames["left_right"]
+        frame2_img = canonical_frames["top_bottom"]
+
+        fake_video = FakeVideoReader(
+            metadata=VideoMetadata(640, 480, 30.0, 600, 20.0),
+            frames=[Frame(0, 0.0, frame1_img), Frame(300, 10.0, frame2_img)]
+        )
+
+        audio_segments = [
+            AudioSegment(12.0, 15.0, "Audio during frame 2"),
+            AudioSegment(2.0, 5.0, "Audio during frame 1"),
+            AudioSegment(10.0, 11.0, "Audio at frame 2 start")
+        ]
+
+        ports = TranscriberPorts(
+            video_reader=fake_video,
+            audio_extractor=FakeAudioExtractor(),
+            audio_transcriber=FakeAudioTranscriber(segments=audio_segments)
+        )
+        config = TranscriberConfig(
+            similarity_threshold=0.51,
+            min_frame_interval=1
+        )
+        transcriber = VideoTranscriber(ports=ports, config=config)
+
+        result = transcriber.process_video("dummy.mp4", sample_interval=1)
+
+        assert [seg.text for seg in result.frames[0].audio_segments] == ["Audio during frame 1"]
+        assert [seg.text for seg in result.frames[1].audio_segments] == [
+            "Audio at frame 2 start",
+            "Audio during frame 2"
+        ]
+
     def test_handles_audio_extraction_failure_gracefully(self):
         """VideoTranscriber continues if audio extraction fails."""
-        frame1 = Frame(0, 0.0, np.zeros((100, 100, 3), dtype=np.uint8))
+        frame1 = tiny_frame(0, 0.0)
 
         fake_video = FakeVideoReader(
             metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
@@ -212,9 +247,81 @@ class TestVideoTranscriberWithAudio:
         # But no audio segments
         assert len(result.audio_segments) == 0
 
+    def test_removes_extracted_audio_file_after_transcription(self):
+        """VideoTranscriber deletes the temporary audio file it asked for."""
+        class WritingAudioExtractor(FakeAudioExtractor):
+            def extract_audio(self, video_path, output_path=None):
+                Path(output_path).write_bytes(b"fake wav data")
+                return super().extract_audio(video_path, output_path)
+
+        fake_audio_extractor = WritingAudioExtractor()
+        ports = TranscriberPorts(
+            video_reader=FakeVideoReader(
+                metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
+                frames=[]
+            ),
+            audio_extractor=fake_audio_extractor,
+            audio_transcriber=FakeAudioTranscriber()
+        )
+        transcriber = VideoTranscriber(ports=ports)
+
+        transcriber.process_video("dummy.mp4", extract_frames=False)
+
+        assert fake_audio_extractor.last_output_path is not None
+        assert not Path(fake_audio_extractor.last_output_path).exists()
+
+    def test_keeps_audio_file_it_did_not_ask_for(self, tmp_path):
+        """An audio file the extractor returns in place of the requested one is left alone."""
+        class ExistingFileAudioExtractor(FakeAudioExtractor):
+            def extract_audio(self, video_path, output_path=None):
+                super().extract_audio(video_path, output_path)
+                return self.audio_file_path
+
+        audio_file = tmp_path / "existing.wav"
+        audio_file.write_bytes(b"fake wav data")
+        fake_audio_transcriber = FakeAudioTranscriber()
+        ports = TranscriberPorts(
+            video_reader=FakeVideoReader(
+                metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
+                frames=[]
+            ),
+            audio_extractor=ExistingFileAudioExtractor(audio_file_path=str(audio_file)),
+            audio_transcriber=fake_audio_transcriber
+        )
+        transcriber = VideoTranscriber(ports=ports)
+
+        transcriber.process_video("dummy.mp4", extract_frames=False)
+
+        assert fake_audio_transcriber.last_audio_path == str(audio_file)
+        assert audio_file.exists()
+
+    def test_passes_audio_samples_in_memory_when_configured(self):
+        """With in_memory_audio, samples go to the transcriber without a temp file."""
+        fake_audio_extractor = FakeAudioExtractor()
+        fake_audio_transcriber = FakeAudioTranscriber(
+            segments=[AudioSegment(0.0, 1.0, "In memory")]
+        )
+        ports = TranscriberPorts(
+            video_reader=FakeVideoReader(
+                metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
+                frames=[]
+            ),
+            audio_extractor=fake_audio_extractor,
+            audio_transcriber=fake_audio_transcriber
+        )
+        transcriber = VideoTranscriber(
+            ports=ports,
+            config=TranscriberConfig(in_memory_audio=True)
+        )
+
+        result = transcriber.process_video("dummy.mp4", extract_frames=False)
+
+        assert isinstance(fake_audio_transcriber.last_audio_path, np.ndarray)
+        assert result.audio_segments[0].text == "In memory"
+
     def test_handles_audio_transcription_failure_gracefully(self):
         """VideoTranscriber continues if audio transcription fails."""
-        frame1 = Frame(0, 0.0, np.zeros((100, 100, 3), dtype=np.uint8))
+        frame1 = tiny_frame(0, 0.0)
 
         fake_video = FakeVideoReader(
             metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
@@ -240,7 +347,7 @@ class TestVideoTranscriberWithAudio:
 
     def test_can_skip_frame_extraction_for_audio_only(self):
         """VideoTranscriber can skip frame extraction to do audio-only transcription."""
-        frame1 = Frame(0, 0.0, np.zeros((100, 100, 3), dtype=np.uint8))
+        frame1 = tiny_frame(0, 0.0)
 
         fake_video = FakeVideoReader(
             metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
@@ -274,15 +381,12 @@ class TestVideoTranscriberWithAudio:
         # Should NOT have any frames
         assert len(result.frames) == 0
 
-    def test_audio_before_first_frame_is_included(self):
+    def test_audio_before_first_frame_is_included(self, canonical_frames):
         """Audio segments that start before the first detected frame are included."""
         # First frame appears at 5.0 seconds (simulating a video where
         # the first distinct frame is detected after some intro content)
-        frame1_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        frame1_img[:, 50:] = 255
-
-        frame2_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        frame2_img[50:, :] = 255
+        frame1_img = canonical_frames["left_right"]
+        frame2_img = canonical_frames["top_bottom"]
 
         frame1 = Frame(150, 5.0, frame1_img)  # First frame at 5 seconds
         frame2 = Frame(450, 15.0, frame2_img)  # Second frame at 15 seconds
@@ -330,3 +434,38 @@ class TestVideoTranscriberWithAudio:
         frame2_audio = result.frames[1].audio_segments
         assert len(frame2_audio) == 1
         assert frame2_audio[0].text == "And here is the second slide"
+
+    def test_extracts_audio_while_frames_are_read(self):
+        """Audio extraction overlaps frame extraction instead of running first."""
+        frames_started = threading.Event()
+
+        class SignallingVideoReader(FakeVideoReader):
+            def read_frames(self, *args, **kwargs):
+                frames_started.set()
+                yield from super().read_frames(*args, **kwargs)
+
+        class WaitingAudioExtractor(FakeAudioExtractor):
+            def extract_audio(self, video_path, output_path=None):
+                self.saw_frames_started = frames_started.wait(timeout=5)
+                return super().extract_audio(video_path, output_path)
+
+        fake_video = SignallingVideoReader(
+            metadata=VideoMetadata(640, 480, 30.0, 30, 1.0),
+            frames=[tiny_frame(0, 0.0)]
+        )
+        fake_audio_extractor = WaitingAudioExtractor()
+        fake_audio_transcriber = FakeAudioTranscriber(
+            segments=[AudioSegment(0.0, 1.0, "Concurrent audio")]
+        )
+
+        ports = TranscriberPorts(
+            video_reader=fake_video,
+            audio_extractor=fake_audio_extractor,
+            audio_transcriber=fake_audio_transcriber
+        )
+        transcriber = VideoTranscriber(ports=ports)
+
+        result = transcriber.process_video("dummy.mp4", sample_interval=1)
+
+        assert fake_audio_extractor.saw_frames_started
+        assert result.frames[0].audio_segments[0].text == "Concurrent audio"
@@ -0,0 +1,51 @@
+"""Tests for WhisperAudioTranscriber compute type selection."""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from video_transcriber.adapters.whisper_audio import WhisperAudioTranscriber
+
+
+def fake_ctranslate2(cuda_devices, supported):
+    """Create a stand-in ctranslate2 module reporting the given device support."""
+    return SimpleNamespace(
+        get_cuda_device_count=lambda: cuda_devices,
+        get_supported_compute_types=lambda device: supported[device],
+    )
+
+
+class TestWhisperComputeType:
+    """Tests for resolving the "auto" compute type."""
+
+    @pytest.mark.parametrize("cuda_types, expected", [
+        ({"float32", "int8_float16", "int8", "float16"}, "int8_float16"),
+        ({"float32", "int8"}, "int8"),
+        ({"float32"}, "auto"),
+    ])
+    def test_auto_picks_best_supported_type_on_cuda(self, monkeypatch, cuda_types, expected):
+        """On CUDA, auto prefers int8_float16, then int8, else defers to CTranslate2."""
+        monkeypatch.setitem(
+            sys.modules, "ctranslate2",
+            fake_ctranslate2(1, {"cuda": cuda_types, "cpu": {"float32", "int8"}})
+        )
+        transcriber = WhisperAudioTranscriber(model_size="tiny")
+
+        assert transcriber._resolve_compute_type() == expected
+
+    def test_auto_uses_cpu_support_without_cuda(self, monkeypatch):
+        """Without a CUDA device, auto picks from the CPU's supported types."""
+        monkeypatch.setitem(
+            sys.modules, "ctranslate2",
+            fake_ctranslate2(0, {"cpu": {"float32", "int8", "int8_float32"}})
+        )
+        transcriber = WhisperAudioTranscriber(model_size="tiny")
+
+        assert transcriber._resolve_compute_type() == "int8"
+
+    def test_explicit_compute_type_is_passed_through(self):
+        """A named compute type is used as given."""
+        transcriber = WhisperAudioTranscriber(model_size="tiny", compute_type="float32")
+
+        assert transcriber._resolve_compute_type() == "float32"
@@ -1,6 +1,6 @@
 """Tests for ZipMarkdownReportGenerator."""
+import io
 import os
-import tempfile
 import zipfile
 from pathlib import Path
 
@@ -11,52 +11,76 @@ from video_transcriber.domain.models import AudioSegment, Frame, FrameResult, Tr
 from video_transcriber.adapters.zip_markdown_report import ZipMarkdownReportGenerator
 
 
-class TestZipMarkdownReportGenerator:
-    """Tests for ZipMarkdownReportGenerator adapter."""
+@pytest.fixture(scope="module")
+def sample_transcript_result(canonical_frames):
+    """Create a sample TranscriptResult with frames and audio."""
+    # Create sample frames with audio segments
+    frame1_obj = Frame(
+        frame_number=0,
+        timestamp_seconds=0.0,
+        image=canonical_frames["black"]
+    )
+    frame1 = FrameResult(
+        frame=frame1_obj,
+        audio_segments=[
+            AudioSegment(0.0, 3.5, "Hello everyone, welcome to today's presentation."),
+            AudioSegment(3.5, 7.0, "Today we'll be discussing video transcription."),
+        ]
+    )
+
+    frame2_obj = Frame(
+        frame_number=30,
+        timestamp_seconds=10.0,
+        image=canonical_frames["gray128"]
+    )
+    frame2 = FrameResult(
+        frame=frame2_obj,
+        audio_segments=[
+            AudioSegment(10.0, 15.0, "Let's start with the key concepts."),
+        ]
+    )
 
-    @pytest.fixture
-    def temp_output_dir(self):
-        """Create a temporary directory for test outputs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
-
-    @pytest.fixture
-    def sample_transcript_result(self):
-        """Create a sample TranscriptResult with frames and audio."""
-        # Create sample frames with audio segments
-        frame1_obj = Frame(
-            frame_number=0,
-            timestamp_seconds=0.0,
-            image=np.zeros((100, 100, 3), dtype=np.uint8)
-        )
-        frame1 = FrameResult(
-            frame=frame1_obj,
-            audio_segments=[
-                AudioSegment(0.0, 3.5, "Hello everyone, welcome to today's presentation."),
-                AudioSegment(3.5, 7.0, "Today we'll be discussing video transcription."),
-            ]
-        )
+    all_audio = frame1.audio_segments + frame2.audio_segments
+    return TranscriptResult(frames=[frame1, frame2], audio_segments=all_audio)
 
-        frame2_obj = Frame(
-            frame_number=30,
-            timestamp_seconds=10.0,
-            image=np.ones((100, 100, 3), dtype=np.uint8) * 128
-        )
-        frame2 = FrameResult(
-            frame=frame2_obj,
-            audio_segments=[
-                AudioSegment(10.0, 15.0, "Let's start with the key concepts."),
-            ]
+
+@pytest.fixture(scope="module")
+def sample_reports(sample_transcript_result):
+    """Zip bytes for the sample result, keyed by include_timestamps.
+
+    Each report is generated once in memory and shared by the tests that
+    only inspect its contents.
+    """
+    reports = {}
+    for include_timestamps in (False, True):
+        buffer = io.BytesIO()
+        ZipMarkdownReportGenerator(include_timestamps=include_timestamps).write(
+            sample_transcript_result, buffer
         )
+        reports[include_timestamps] = buffer.getvalue()
+    return reports
+
 
-        all_audio = frame1.audio_segments + frame2.audio_segments
-        return TranscriptResult(frames=[frame1, frame2], audio_segments=all_audio)
+def open_report(report_bytes):
+    """Open in-memory zip report bytes for reading."""
+    return zipfile.ZipFile(io.BytesIO(report_bytes), 'r')
 
-    def test_generates_zip_with_markdown_and_images(self, temp_output_dir, sample_transcript_result):
+
+def write_report(generator, result):
+    """Write a report into memory and return its bytes."""
+    buffer = io.BytesIO()
+    generator.write(result, buffer)
+    return buffer.getvalue()
+
+
+class TestZipMarkdownReportGenerator:
+    """Tests for ZipMarkdownReportGenerator adapter."""
+
+    def test_generates_zip_with_markdown_and_images(self, tmp_path, sample_transcript_result):
         """Test that generator creates a zip file with markdown and images."""
         # Given: A TranscriptResult
         generator = ZipMarkdownReportGenerator()
-        output_path = os.path.join(temp_output_dir, "report.zip")
+        output_path = str(tmp_path / "report.zip")
 
         # When: Generate zip report
         result_path = generator.generate(sample_transcript_result, output_path=output_path)
@@ -72,59 +96,91 @@ class TestZipMarkdownReportGenerator:
             assert "img/frame_000.png" in namelist
             assert "img/frame_001.png" in namelist
 
-    def test_markdown_contains_timeline_merged_content(self, temp_output_dir, sample_transcript_result):
-        """Test that markdown contains frames with their associated audio segments."""
-        # Given: A TranscriptResult with frames and audio, timestamps enabled
-        generator = ZipMarkdownReportGenerator(include_timestamps=True)
-        output_path = os.path.join(temp_output_dir, "report.zip")
+    def test_stores_images_uncompressed_and_deflates_markdown(self, sample_reports):
+        """Test that PNG entries skip a second deflate pass but markdown is compressed."""
+        # Given: A report from the default generator
+        # Then: Images are stored and markdown is deflated
+        with open_report(sample_reports[False]) as zf:
+            assert zf.getinfo("img/frame_000.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("transcript.md").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_images_are_written_in_frame_order(self):
+        """Test that parallel encoding keeps each image with its own frame."""
+        # Given: Frames with distinct solid colours
+        frames = [
+            FrameResult(frame=Frame(i, float(i), np.full((10, 10, 3), i * 20, dtype=np.uint8)))
+            for i in range(10)
+        ]
+        generator = ZipMarkdownReportGenerator()
 
         # When: Generate zip report
-        generator.generate(sample_transcript_result, output_path=output_path)
+        report = write_report(generator, TranscriptResult(frames=frames, audio_segments=[]))
 
+        # Then: Each image holds its frame's pixels
+        with open_report(report) as zf:
+            for i, frame in enumerate(frames):
+                assert zf.read(f"img/frame_{i:03d}.png") == frame.to_png_bytes()
+
+    def test_writes_jpeg_images_when_requested(self, sample_transcript_result):
+        """Test that JPEG output uses .jpg entries and links."""
+        # Given: A generator configured for JPEG images
+        generator = ZipMarkdownReportGenerator(image_format="jpeg")
+
+        # When: Generate zip report
+        report = write_report(generator, sample_transcript_result)
+
+        # Then: Images are JPEGs and the markdown links to them
+        with open_report(report) as zf:
+            assert zf.read("img/frame_000.jpg").startswith(b"\xff\xd8")
+            assert "img/frame_001.jpg" in zf.namelist()
+            assert "img/frame_000.png" not in zf.namelist()
+            assert "(img/frame_000.jpg)" in zf.read("transcript.md").decode('utf-8')
+
+    def test_rejects_unknown_image_format(self):
+        """Test that an unsupported image format is reported up front."""
+        with pytest.raises(ValueError):
+            ZipMarkdownReportGenerator(image_format="gif")
+
+    def test_markdown_contains_timeline_merged_content(self, sample_reports):
+        """Test that markdown contains frames with their associated audio segments."""
+        # Given: A report for frames and audio, timestamps enabled
         # Then: Markdown contains timeline structure
-        with zipfile.ZipFile(output_path, 'r') as zf:
-            markdown_content = zf.read("transcript.md").decode('utf-8')
+        with open_report(sample_reports[True]) as zf:
+            # All expected text is ASCII, so check the raw bytes without decoding
+            markdown_content = zf.read("transcript.md")
 
             # Check for frame headers with timestamps
-            assert "## Frame 1" in markdown_content or "## Slide 1" in markdown_content
-            assert "0:00" in markdown_content or "00:00" in markdown_content
+            assert b"## Frame 1" in markdown_content or b"## Slide 1" in markdown_content
+            assert b"0:00" in markdown_content or b"00:00" in markdown_content
 
             # Check for image links
-            assert "![" in markdown_content
-            assert "img/frame_000.png" in markdown_content
+            assert b"![" in markdown_content
+            assert b"img/frame_000.png" in markdown_content
 
             # Check for audio transcription
-            assert "Hello everyone" in markdown_content
-            assert "Today we'll be discussing" in markdown_content
+            assert b"Hello everyone" in markdown_content
+            assert b"Today we'll be discussing" in markdown_content
 
-    def test_handles_empty_frames(self, temp_output_dir):
+    def test_handles_empty_frames(self):
         """Test that generator handles TranscriptResult with no frames."""
         # Given: A TranscriptResult with no frames
         result = TranscriptResult(frames=[], audio_segments=[])
         generator = ZipMarkdownReportGenerator()
-        output_path = os.path.join(temp_output_dir, "empty.zip")
 
         # When: Generate zip report
-        result_path = generator.generate(result, output_path=output_path)
+        report = write_report(generator, result)
 
-        # Then: Zip file exists and contains markdown (even if empty)
-        assert os.path.exists(result_path)
-        with zipfile.ZipFile(result_path, 'r') as zf:
+        # Then: Zip contains markdown (even if empty)
+        with open_report(report) as zf:
             assert "transcript.md" in zf.namelist()
             markdown_content = zf.read("transcript.md").decode('utf-8')
             assert len(markdown_content) > 0  # Should have at least a title or message
 
-    def test_excludes_timestamps_by_default(self, temp_output_dir, sample_transcript_result):
+    def test_excludes_timestamps_by_default(self, sample_reports):
         """Test that timestamps are excluded from markdown by default."""
-        # Given: A TranscriptResult and default generator settings
-        generator = ZipMarkdownReportGenerator()
-        output_path = os.path.join(temp_output_dir, "report.zip")
-
-        # When: Generate zip report
-        generator.generate(sample_transcript_result, output_path=output_path)
-
+        # Given: A report from default generator settings
         # Then: Markdown does NOT contain timestamps
-        with zipfile.ZipFile(output_path, 'r') as zf:
+        with open_report(sample_reports[False]) as zf:
             markdown_content = zf.read("transcript.md").decode('utf-8')
 
             # Slide headers should NOT have timestamps
@@ -135,17 +191,11 @@ class TestZipMarkdownReportGenerator:
             assert "Hello everyone" in markdown_content
             assert "[0:00 - " not in markdown_content
 
-    def test_includes_timestamps_when_enabled(self, temp_output_dir, sample_transcript_result):
+    def test_includes_timestamps_when_enabled(self, sample_reports):
         """Test that timestamps are included when include_timestamps=True."""
-        # Given: A TranscriptResult and generator with timestamps enabled
-        generator = ZipMarkdownReportGenerator(include_timestamps=True)
-        output_path = os.path.join(temp_output_dir, "report.zip")
-
-        # When: Generate zip report
-        generator.generate(sample_transcript_result, output_path=output_path)
-
+        # Given: A report from a generator with timestamps enabled
         # Then: Markdown contains timestamps
-        with zipfile.ZipFile(output_path, 'r') as zf:
+        with open_report(sample_reports[True]) as zf:
             markdown_content = zf.read("transcript.md").decode('utf-8')
 
             # Slide headers should have timestamps
@@ -154,7 +204,7 @@ class TestZipMarkdownReportGenerator:
             # Audio segments should have timestamp prefixes
             assert "[0:00 - 0:03]" in markdown_content or "[0:00 - 3:30]" in markdown_content
 
-    def test_generates_audio_only_transcript(self, temp_output_dir):
+    def test_generates_audio_only_transcript(self):
         """Test that generator produces proper output for audio-only (no frames)."""
         # Given: A TranscriptResult with only audio segments (no frames)
         audio_segments = [
@@ -164,13 +214,12 @@ class TestZipMarkdownReportGenerator:
         ]
         result = TranscriptResult(frames=[], audio_segments=audio_segments)
         generator = ZipMarkdownReportGenerator(include_timestamps=True)
-        output_path = os.path.join(temp_output_dir, "audio_only.zip")
 
         # When: Generate zip report
-        generator.generate(result, output_path=output_path)
+        report = write_report(generator, result)
 
         # Then: Zip contains markdown with audio transcript
-        with zipfile.ZipFile(output_path, 'r') as zf:
+        with open_report(report) as zf:
             markdown_content = zf.read("transcript.md").decode('utf-8')
 
             # Should have title and audio content